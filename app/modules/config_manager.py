@@ -9,6 +9,7 @@ import os
 import sys
 import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass, asdict, field
@@ -181,6 +182,9 @@ class ConfigManager(ConfigurableService):
         # 应用配置
         self._config = AppConfig()
         self._lock = threading.RLock()
+
+        # 批量更新期间推迟写文件（由 update_config 设置，结束后统一保存一次）
+        self._defer_save = False
         
         # 配置变更监听器
         self._change_listeners: Dict[str, List[callable]] = {}
@@ -362,6 +366,10 @@ class ConfigManager(ConfigurableService):
         """保存配置"""
         try:
             with self._lock:
+                # 批量更新中，_saving_deferred() 代码块内（如 update_config）推迟保存，由调用方在结束时统一保存
+                if self._defer_save:
+                    return True
+
                 # 更新元数据
                 from datetime import datetime
                 self._config.last_modified = datetime.now().isoformat()
@@ -844,35 +852,50 @@ class ConfigManager(ConfigurableService):
     # ConfigurableService接口实现
 
     def update_config(self, config: Dict[str, Any]) -> bool:
-        """更新配置（通用接口）"""
+        """更新配置（通用接口）- 多个配置部分只写一次文件"""
         try:
             success = True
 
-            for section, section_config in config.items():
-                if section == "accounting":
-                    success &= self.update_accounting_config(**section_config)
-                elif section == "wechat_monitor":
-                    success &= self.update_wechat_monitor_config(**section_config)
-                elif section == "wxauto":
-                    success &= self.update_wxauto_config(**section_config)
-                elif section == "log":
-                    success &= self.update_log_config(**section_config)
-                elif section == "service_monitor":
-                    success &= self.update_service_monitor_config(**section_config)
-                elif section == "ui":
-                    success &= self.update_ui_config(**section_config)
-                elif section == "system":
-                    success &= self.update_system_config(**section_config)
-                else:
-                    logger.warning(f"未知配置部分: {section}")
-                    success = False
-
-            return success
+            with self._lock:
+                with self._saving_deferred():
+                    for section, section_config in config.items():
+                        if section == "accounting":
+                            success &= self.update_accounting_config(**section_config)
+                        elif section == "wechat_monitor":
+                            success &= self.update_wechat_monitor_config(**section_config)
+                        elif section == "wxauto":
+                            success &= self.update_wxauto_config(**section_config)
+                        elif section == "log":
+                            success &= self.update_log_config(**section_config)
+                        elif section == "service_monitor":
+                            success &= self.update_service_monitor_config(**section_config)
+                        elif section == "ui":
+                            success &= self.update_ui_config(**section_config)
+                        elif section == "system":
+                            success &= self.update_system_config(**section_config)
+                        else:
+                            logger.warning(f"未知配置部分: {section}")
+                            success = False
+
+                # 所有配置部分更新完成后统一保存
+                saved = self.save_config()
+
+            return success and saved
 
         except Exception as e:
             logger.error(f"更新配置失败: {e}")
             return False
 
+    @contextmanager
+    def _saving_deferred(self):
+        """在代码块内推迟保存（可嵌套，恢复进入前的状态）"""
+        previous = self._defer_save
+        self._defer_save = True
+        try:
+            yield
+        finally:
+            self._defer_save = previous
+
     def get_config_dict(self) -> Dict[str, Any]:
         """获取配置字典（通用接口）"""
         with self._lock:
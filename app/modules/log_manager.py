@@ -9,7 +9,7 @@ import time
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from collections import deque
 from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -106,6 +106,19 @@ class EnhancedMemoryLogHandler(logging.Handler):
             
             return logs
     
+    def iter_logs(self, level_filter=None):
+        """迭代日志，仅在锁内复制引用快照，不构建过滤后的列表"""
+        with self.lock:
+            snapshot = tuple(self.buffer)
+
+        if isinstance(level_filter, str):
+            level_filter = [level_filter]
+
+        for log in snapshot:
+            if level_filter and log['level'] not in level_filter:
+                continue
+            yield log
+    
     def get_stats(self):
         """获取统计信息"""
         with self.lock:
@@ -364,6 +377,10 @@ class LogManager(BaseService, ILogManager):
             logger.error(f"获取日志失败: {e}")
             return []
     
+    def iter_logs(self, level_filter: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """逐条迭代日志"""
+        return self.memory_handler.iter_logs(level_filter)
+
     def clear_logs(self) -> bool:
         """清空日志"""
         try:
@@ -5,12 +5,18 @@
 """
 
 import logging
+import queue
+import threading
+from collections import deque
+from operator import itemgetter
+from logging.handlers import QueueHandler
 from datetime import datetime
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
                              QPushButton, QCheckBox, QLabel, QFrame, QSplitter,
                              QGroupBox, QLineEdit, QComboBox, QFileDialog, 
                              QMessageBox, QProgressBar, QTabWidget)
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThread, QMutex, QMutexLocker
+from PyQt6.QtCore import (Qt, pyqtSignal, pyqtSlot, QThread, QMutex,
+                          QMutexLocker, QMetaObject)
 from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
 
 # 导入日志系统
@@ -34,8 +40,106 @@ except ImportError:
     def get_log_manager():
         return None
 
+
+# 日志条目字段提取器（LogManager保证每条日志都包含这些字段）
+_LOG_ENTRY_FIELDS = itemgetter('message', 'level', 'timestamp')
+
+# HTML转义表（单次translate代替多次replace）
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+
+class QueueLogReaderThread(QThread):
+    """日志队列读取线程（日志管理器不可用时的备用方案）"""
+    new_log = pyqtSignal(str, str)  # (message, level)
+
+    def __init__(self, log_queue):
+        super().__init__()
+        self.log_queue = log_queue
+
+    def run(self):
+        """阻塞读取队列中的日志记录并转发"""
+        while True:
+            record = self.log_queue.get()
+            if record is None:
+                break
+
+            try:
+                self.new_log.emit(record.getMessage(), record.levelname)
+            except Exception as e:
+                print(f"转发队列日志失败: {e}")
+
+    def stop(self):
+        """停止读取线程"""
+        self.log_queue.put_nowait(None)
+        self.wait(1000)
+
+
+class LogStatsPollerThread(QThread):
+    """日志统计轮询线程，避免在界面线程中访问日志管理器"""
+    stats_ready = pyqtSignal(dict)  # (stats)
+    stats_failed = pyqtSignal(str)  # (error)
+
+    def __init__(self, log_manager, interval=5.0):
+        super().__init__()
+        self.log_manager = log_manager
+        self.interval = interval
+        self._stop_event = threading.Event()    # 置位时线程退出
+        self._active_event = threading.Event()  # 清除时暂停轮询
+        self._wake_event = threading.Event()    # 打断轮询间隔，立即获取一次
+
+    def run(self):
+        """定期获取统计信息并发出信号，暂停期间阻塞等待恢复"""
+        while not self._stop_event.is_set():
+            self._active_event.wait()
+            if self._stop_event.is_set():
+                break
+
+            try:
+                self.stats_ready.emit(self.log_manager.get_stats())
+            except Exception as e:
+                self.stats_failed.emit(str(e))
+
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
+
+    def start_polling(self):
+        """开始或恢复轮询（立即获取一次）"""
+        self._stop_event.clear()
+        if not self.isRunning():
+            self.start()
+        self._active_event.set()
+        self._wake_event.set()
+
+    def stop_polling(self):
+        """暂停轮询（只设置标志，线程保持运行，不阻塞界面线程）"""
+        self._active_event.clear()
+
+    def shutdown(self):
+        """结束轮询线程"""
+        self._stop_event.set()
+        self._active_event.set()
+        self._wake_event.set()
+        self.wait(1000)
+
+
 class RobustLogDisplayWidget(QTextEdit):
     """健壮的日志显示组件"""
+
+    # 日志级别对应的颜色
+    LOG_COLORS = {
+        'DEBUG': '#9cdcfe',    # 浅蓝色
+        'INFO': '#d4d4d4',     # 白色
+        'WARNING': '#dcdcaa',  # 黄色
+        'ERROR': '#f44747',    # 红色
+        'CRITICAL': '#ff6b6b'  # 亮红色
+    }
+    DEFAULT_LOG_COLOR = '#d4d4d4'
+
+    # 预先生成的各级别HTML前缀
+    _LEVEL_SPAN_PREFIX = {
+        level: f'<span style="color: {color};">' for level, color in LOG_COLORS.items()
+    }
+    _DEFAULT_SPAN_PREFIX = f'<span style="color: {DEFAULT_LOG_COLOR};">'
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -46,21 +150,31 @@ class RobustLogDisplayWidget(QTextEdit):
         self.current_lines = 0
         self.auto_scroll = True
         self.user_scrolled_up = False
+        self._suppress_scroll_detect = False
+
+        # 历史日志末尾的哈希（仅在首次刷新实时日志前，用于去重历史与实时信号的重叠部分）
+        self._recent_msg_hashes = deque(maxlen=64)
         
         # 线程安全
         self.mutex = QMutex()
+
+        # 备用日志管道（日志管理器不可用时使用）
+        self.queue_handler = None
+        self.log_reader_thread = None
         
         # 设置字体和样式
         self._setup_appearance()
         
+        # 停留在文档末尾的光标（只追加日志，复用同一个光标）
+        self._tail_cursor = self._create_tail_cursor()
+        
         # 连接滚动事件
         self._setup_scroll_detection()
         
         # 日志缓冲区（用于批量更新）
-        self.log_buffer = []
-        self.buffer_timer = QTimer()
-        self.buffer_timer.timeout.connect(self._flush_log_buffer)
-        self.buffer_timer.setSingleShot(True)
+        # 缓冲区由空变为非空时投递一次刷新事件，同一批日志合并刷新
+        # 窗口隐藏时暂不刷新，缓冲区最多保留max_lines条
+        self.log_buffer = deque(maxlen=self.max_lines)
         
         # 连接日志信号
         self._connect_log_signals()
@@ -109,6 +223,10 @@ class RobustLogDisplayWidget(QTextEdit):
     
     def _on_scroll_changed(self, value):
         """滚动位置改变"""
+        # 程序触发的自动滚动不参与用户滚动判断
+        if self._suppress_scroll_detect:
+            return
+
         scrollbar = self.verticalScrollBar()
         max_value = scrollbar.maximum()
         
@@ -144,36 +262,71 @@ class RobustLogDisplayWidget(QTextEdit):
             else:
                 logger.warning("日志管理器不可用")
 
-                # 使用定时器定期检查日志
-                self.log_check_timer = QTimer()
-                self.log_check_timer.timeout.connect(self._check_logs_periodically)
-                self.log_check_timer.start(1000)  # 每秒检查一次
+                # 使用QueueHandler直接接收日志记录
+                self._start_queue_pipeline()
 
         except Exception as e:
             logger.error(f"连接日志信号失败: {e}")
 
-            # 备用方案：使用定时器
-            self.log_check_timer = QTimer()
-            self.log_check_timer.timeout.connect(self._check_logs_periodically)
-            self.log_check_timer.start(1000)
+            # 备用方案：使用QueueHandler
+            self._start_queue_pipeline()
+
+    def _start_queue_pipeline(self):
+        """启动QueueHandler日志管道（备用方案）"""
+        if self.log_reader_thread:
+            return
+
+        log_queue = queue.Queue()
+        self.queue_handler = QueueHandler(log_queue)
+        self.queue_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+        logging.getLogger().addHandler(self.queue_handler)
+
+        self.log_reader_thread = QueueLogReaderThread(log_queue)
+        self.log_reader_thread.new_log.connect(
+            self._on_new_log,
+            Qt.ConnectionType.QueuedConnection
+        )
+        self.log_reader_thread.start()
+
+    def stop_queue_pipeline(self):
+        """停止QueueHandler日志管道"""
+        if self.queue_handler:
+            logging.getLogger().removeHandler(self.queue_handler)
+            self.queue_handler = None
+
+        if self.log_reader_thread:
+            self.log_reader_thread.stop()
+            self.log_reader_thread = None
     
     def _on_new_log(self, log_text, log_level):
         """处理新日志信号"""
         try:
-            # 添加到缓冲区
+            # 跳过已随历史日志加载的重复消息
+            if self._is_duplicate_log(log_text):
+                return
+
+            # 添加到缓冲区，仅在缓冲区由空变为非空时投递刷新
+            was_empty = not self.log_buffer
             self.log_buffer.append((log_text, log_level))
-            
-            # 启动缓冲区刷新定时器（延迟50ms批量处理）
-            if not self.buffer_timer.isActive():
-                self.buffer_timer.start(50)
+            if was_empty:
+                self.schedule_flush()
                 
         except Exception as e:
             print(f"处理新日志信号失败: {e}")
     
+    def schedule_flush(self):
+        """通过事件循环投递一次缓冲区刷新"""
+        QMetaObject.invokeMethod(self, "_flush_log_buffer",
+                                 Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot()
     def _flush_log_buffer(self):
         """刷新日志缓冲区"""
         try:
-            if not self.log_buffer:
+            # 窗口隐藏时保留缓冲区，待显示后再刷新
+            if not self.log_buffer or not self.isVisible():
                 return
             
             with QMutexLocker(self.mutex):
@@ -183,6 +336,9 @@ class RobustLogDisplayWidget(QTextEdit):
                 
                 # 清空缓冲区
                 self.log_buffer.clear()
+
+                # 历史日志与实时信号的重叠只可能出现在首次刷新之前
+                self._recent_msg_hashes.clear()
                 
                 # 自动滚动
                 if self.auto_scroll and not self.user_scrolled_up:
@@ -194,20 +350,8 @@ class RobustLogDisplayWidget(QTextEdit):
     def _append_log_internal(self, log_text, log_level):
         """内部日志添加方法"""
         try:
-            # 获取颜色
-            color = self._get_log_color(log_level)
-            
-            # 移动到文档末尾
-            cursor = self.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            
-            # 转义HTML
-            escaped_text = (log_text.replace('&', '&amp;')
-                                   .replace('<', '&lt;')
-                                   .replace('>', '&gt;'))
-            
-            # 插入带颜色的文本
-            cursor.insertHtml(f'<span style="color: {color};">{escaped_text}</span><br>')
+            # 插入带颜色的文本（尾部光标插入后仍位于文档末尾）
+            self._tail_cursor.insertHtml(self._format_log_html(log_text, log_level))
             
             # 更新行数
             self.current_lines += 1
@@ -219,28 +363,31 @@ class RobustLogDisplayWidget(QTextEdit):
         except Exception as e:
             print(f"添加日志失败: {e}")
     
-    def _get_log_color(self, log_level):
-        """获取日志级别对应的颜色"""
-        colors = {
-            'DEBUG': '#9cdcfe',    # 浅蓝色
-            'INFO': '#d4d4d4',     # 白色
-            'WARNING': '#dcdcaa',  # 黄色
-            'ERROR': '#f44747',    # 红色
-            'CRITICAL': '#ff6b6b'  # 亮红色
-        }
-        return colors.get(log_level, '#d4d4d4')
+    def _create_tail_cursor(self):
+        """创建位于文档末尾的光标"""
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        return cursor
+    
+    def _format_log_html(self, log_text, log_level):
+        """将日志格式化为带颜色的HTML片段"""
+        prefix = self._LEVEL_SPAN_PREFIX.get(log_level, self._DEFAULT_SPAN_PREFIX)
+
+        # 转义HTML
+        escaped_text = log_text.translate(_HTML_ESCAPE)
+
+        return ''.join((prefix, escaped_text, '</span><br>'))
     
     def _scroll_to_bottom(self):
         """滚动到底部"""
         try:
-            cursor = self.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.setTextCursor(cursor)
-            self.ensureCursorVisible()
-            
-            # 强制滚动条到底部
+            # 直接将滚动条移到底部，避免移动光标触发额外的布局
             scrollbar = self.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+            self._suppress_scroll_detect = True
+            try:
+                scrollbar.setValue(scrollbar.maximum())
+            finally:
+                self._suppress_scroll_detect = False
             
         except Exception as e:
             print(f"滚动到底部失败: {e}")
@@ -275,20 +422,23 @@ class RobustLogDisplayWidget(QTextEdit):
             logs = log_manager.get_logs(limit=1000)
 
             if logs:
-                with QMutexLocker(self.mutex):
-                    for log_entry in logs:
-                        if isinstance(log_entry, dict):
-                            message = log_entry.get('message', '')
-                            level = log_entry.get('level', 'INFO')
-                            timestamp = log_entry.get('timestamp', '')
+                # 先格式化全部历史日志，再一次性插入文档
+                format_html = self._format_log_html
+                fragments = []
+                for log_entry in logs:
+                    message, level, timestamp = _LOG_ENTRY_FIELDS(log_entry)
+                    fragments.append(format_html(''.join(('[', timestamp, '] ', message)), level))
 
-                            # 格式化消息
-                            if timestamp:
-                                formatted_message = f"[{timestamp}] {message}"
-                            else:
-                                formatted_message = message
+                # 记录末尾日志的哈希，用于与实时信号去重
+                recent_logs = logs[-self._recent_msg_hashes.maxlen:]
+                self._recent_msg_hashes.extend(hash(log_entry['message'][:128]) for log_entry in recent_logs)
 
-                            self._append_log_internal(formatted_message, level)
+                with QMutexLocker(self.mutex):
+                    self._tail_cursor.insertHtml(''.join(fragments))
+                    self.current_lines += len(fragments)
+
+                    if self.current_lines > self.max_lines:
+                        self._trim_logs()
 
                 # 滚动到底部
                 self._scroll_to_bottom()
@@ -298,68 +448,48 @@ class RobustLogDisplayWidget(QTextEdit):
         except Exception as e:
             logger.error(f"加载现有日志失败: {e}")
     
-    def _check_logs_periodically(self):
-        """定期检查日志（备用方案）"""
-        try:
-            log_manager = get_log_manager()
-            if not log_manager:
-                return
-
-            # 获取最新的日志
-            logs = log_manager.get_logs(limit=10)
-
-            if logs:
-                # 检查是否有新日志
-                for log_entry in logs[-5:]:  # 只检查最后5条
-                    if isinstance(log_entry, dict):
-                        message = log_entry.get('message', '')
-                        level = log_entry.get('level', 'INFO')
-                        timestamp = log_entry.get('timestamp', '')
-
-                        # 简单的去重检查（基于消息内容）
-                        if message and not self._is_duplicate_log(message):
-                            formatted_message = f"[{timestamp}] {message}" if timestamp else message
-                            self._on_new_log(formatted_message, level)
-
-        except Exception as e:
-            print(f"定期检查日志失败: {e}")
-    
     def _is_duplicate_log(self, message):
-        """简单的重复日志检查"""
-        try:
-            # 获取最后几行文本
-            cursor = self.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-            cursor.movePosition(QTextCursor.MoveOperation.Up, 
-                              QTextCursor.MoveMode.KeepAnchor, 3)
-            recent_text = cursor.selectedText()
-            
-            # 检查消息是否已存在
-            return message[:50] in recent_text
-            
-        except Exception:
+        """检查实时日志是否已随历史日志加载（每条历史日志最多抵消一条实时日志）"""
+        if not self._recent_msg_hashes:
+            return False
+
+        msg_hash = hash(message[:128])
+        if msg_hash not in self._recent_msg_hashes:
             return False
+
+        self._recent_msg_hashes.remove(msg_hash)
+        return True
     
     def clear_logs(self):
         """清空日志"""
         with QMutexLocker(self.mutex):
             self.clear()
+            self._tail_cursor = self._create_tail_cursor()
             self.current_lines = 0
             self.log_buffer.clear()
+            self._recent_msg_hashes.clear()
     
     def export_logs(self, filename):
         """导出日志"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open(filename, 'w', encoding='utf-8', buffering=64 * 1024) as f:
                 log_manager = get_log_manager()
                 if log_manager:
-                    logs = log_manager.get_logs()
-                    for log_entry in logs:
+                    # 逐条迭代日志，每1000行合并写入一次
+                    chunk = []
+                    for log_entry in log_manager.iter_logs():
                         if isinstance(log_entry, dict):
                             timestamp = log_entry.get('timestamp', '')
                             level = log_entry.get('level', '')
                             message = log_entry.get('message', '')
-                            f.write(f"[{timestamp}] {level}: {message}\n")
+                            chunk.append(f"[{timestamp}] {level}: {message}\n")
+
+                            if len(chunk) >= 1000:
+                                f.write(''.join(chunk))
+                                chunk.clear()
+
+                    if chunk:
+                        f.write(''.join(chunk))
                 else:
                     f.write(self.toPlainText())
             return True
@@ -387,6 +517,7 @@ class EnhancedLogWindow(QWidget):
 
         # 初始化属性
         self.log_display = None
+        self.stats_poller = None
 
         self.setup_ui()
 
@@ -396,16 +527,13 @@ class EnhancedLogWindow(QWidget):
     def closeEvent(self, event):
         """窗口关闭事件"""
         try:
-            # 停止定时器
-            if hasattr(self, 'stats_timer') and self.stats_timer:
-                self.stats_timer.stop()
+            # 结束统计轮询线程
+            if self.stats_poller:
+                self.stats_poller.shutdown()
 
             # 清理日志显示组件
             if self.log_display:
-                if hasattr(self.log_display, 'log_check_timer'):
-                    self.log_display.log_check_timer.stop()
-                if hasattr(self.log_display, 'buffer_timer'):
-                    self.log_display.buffer_timer.stop()
+                self.log_display.stop_queue_pipeline()
 
             logger.info("日志窗口已关闭")
 
@@ -414,6 +542,26 @@ class EnhancedLogWindow(QWidget):
 
         # 接受关闭事件
         event.accept()
+
+    def showEvent(self, event):
+        """窗口显示事件"""
+        super().showEvent(event)
+
+        # 恢复统计轮询（启动后立即获取一次）
+        if self.stats_poller:
+            self.stats_poller.start_polling()
+
+        # 刷新隐藏期间积累的日志
+        if self.log_display:
+            self.log_display.schedule_flush()
+
+    def hideEvent(self, event):
+        """窗口隐藏事件"""
+        super().hideEvent(event)
+
+        # 窗口不可见时暂停统计轮询
+        if self.stats_poller:
+            self.stats_poller.stop_polling()
     
     def setup_ui(self):
         """设置UI"""
@@ -481,10 +629,20 @@ class EnhancedLogWindow(QWidget):
         self.stats_label = QLabel("统计: 0 条日志")
         layout.addWidget(self.stats_label)
         
-        # 更新统计的定时器
-        self.stats_timer = QTimer()
-        self.stats_timer.timeout.connect(self._update_stats)
-        self.stats_timer.start(5000)  # 每5秒更新一次
+        # 统计轮询线程（窗口可见时每5秒更新一次）
+        log_manager = get_log_manager()
+        if log_manager:
+            self.stats_poller = LogStatsPollerThread(log_manager, interval=5.0)
+            self.stats_poller.stats_ready.connect(
+                self._update_stats,
+                Qt.ConnectionType.QueuedConnection
+            )
+            self.stats_poller.stats_failed.connect(
+                self._on_stats_failed,
+                Qt.ConnectionType.QueuedConnection
+            )
+        else:
+            self.stats_label.setText("统计: 日志管理器不可用")
         
         return status_bar
     
@@ -530,18 +688,17 @@ class EnhancedLogWindow(QWidget):
         except Exception as e:
             logger.error(f"清空日志失败: {e}")
 
-    def _update_stats(self):
+    def _update_stats(self, stats):
         """更新统计信息"""
         try:
-            log_manager = get_log_manager()
-            if log_manager:
-                stats = log_manager.get_stats()
-                memory_stats = stats.get('memory_stats', {})
-                total = memory_stats.get('total_logs', 0)
-                errors = memory_stats.get('error_logs', 0)
-                self.stats_label.setText(f"统计: {total} 条日志, {errors} 条错误")
-            else:
-                self.stats_label.setText("统计: 日志管理器不可用")
+            memory_stats = stats.get('memory_stats', {})
+            total = memory_stats.get('total_logs', 0)
+            errors = memory_stats.get('error_logs', 0)
+            self.stats_label.setText(f"统计: {total} 条日志, {errors} 条错误")
 
         except Exception as e:
-            self.stats_label.setText(f"统计: 获取失败 - {e}")
+            self._on_stats_failed(str(e))
+
+    def _on_stats_failed(self, error):
+        """统计信息获取失败"""
+        self.stats_label.setText(f"统计: 获取失败 - {error}")
@@ -4,20 +4,273 @@
 """
 
 import math
+import random
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
 from PyQt6.QtWidgets import (QPushButton, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QDialog, QLineEdit, QComboBox, QCheckBox,
                              QSpinBox, QTextEdit, QRadioButton, QButtonGroup,
-                             QGraphicsDropShadowEffect, QGraphicsBlurEffect)
-from PyQt6.QtCore import (Qt, pyqtSignal, QTimer, QPropertyAnimation, QRect,
-                          QEasingCurve, QPoint, QPointF, QParallelAnimationGroup,
+                             QGraphicsBlurEffect)
+from PyQt6.QtCore import (Qt, QObject, pyqtSignal, QTimer, QElapsedTimer, QPropertyAnimation, QRect,
+                          QMargins,
+                          QEasingCurve, QPoint, QPointF, QLineF, QRectF, QParallelAnimationGroup,
                           QSequentialAnimationGroup, QVariantAnimation, pyqtProperty)
 from PyQt6.QtGui import (QFont, QPalette, QColor, QPainter, QPen, QBrush,
-                         QLinearGradient, QRadialGradient, QPainterPath,
-                         QPixmap, QConicalGradient)
+                         QLinearGradient, QRadialGradient, QGradient, QPainterPath,
+                         QPixmap, QImage, QConicalGradient, QStaticText, QTransform)
+
+
+class _RepaintScheduler(QObject):
+    """重绘调度器 - 将动画属性触发的重绘合并为每帧（约60Hz）一次"""
+
+    FRAME_INTERVAL_MS = 16
+
+    def __init__(self):
+        super().__init__()
+        self._pending = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self._flush)
+
+    def schedule(self, widget):
+        """标记控件需要重绘，定时器仅在有待重绘控件时运行"""
+        if widget._needs_repaint:
+            return
+
+        widget._needs_repaint = True
+        self._pending.append(widget)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        """每帧统一触发一次重绘"""
+        pending, self._pending = self._pending, []
+        for widget in pending:
+            widget._needs_repaint = False
+            try:
+                widget.update()
+            except RuntimeError:
+                # 控件已被销毁
+                pass
+
+        if not self._pending:
+            self._timer.stop()
+
+
+_repaint_scheduler = None
+
+
+def _schedule_repaint(widget):
+    """通过共享的重绘调度器请求重绘"""
+    global _repaint_scheduler
+    if _repaint_scheduler is None:
+        _repaint_scheduler = _RepaintScheduler()
+    _repaint_scheduler.schedule(widget)
+
+
+class _PulseClock(QObject):
+    """共享脉冲时钟 - 所有控件的脉冲动画共用一个定时器
+
+    脉冲值只是时间的函数，由各控件在 paintEvent 中通过 phase() 读取；
+    定时器只负责通知订阅者重绘，不再逐帧传递数值。
+    """
+
+    tick = pyqtSignal()
+
+    PERIOD_MS = 2000
+    FRAME_INTERVAL_MS = 16
+
+    def __init__(self):
+        super().__init__()
+        self._elapsed = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def subscribe(self, slot):
+        """订阅重绘通知，首个订阅者加入时启动定时器"""
+        self.tick.connect(slot)
+        if not self._timer.isActive():
+            self._elapsed.start()
+            self._timer.start()
+
+    def unsubscribe(self, slot):
+        """取消订阅，没有订阅者时停止定时器"""
+        try:
+            self.tick.disconnect(slot)
+        except TypeError:
+            pass
+
+        if self.receivers(self.tick) == 0:
+            self._timer.stop()
+
+    def phase(self):
+        """当前脉冲值，时钟未运行时为0
+
+        与原关键帧动画（0→1→0，整体使用InOutSine缓动）一致：
+        先对周期进度做InOutSine缓动，再在关键帧之间线性插值，
+        因此每个周期在0附近停顿，在1处折返。
+        """
+        if not self._timer.isActive():
+            return 0.0
+        t = (self._elapsed.elapsed() % self.PERIOD_MS) / self.PERIOD_MS
+        eased = 0.5 - 0.5 * math.cos(math.pi * t)
+        return 1.0 - abs(2.0 * eased - 1.0)
+
+    def _tick(self):
+        """通知订阅者重绘"""
+        if self.receivers(self.tick) == 0:
+            self._timer.stop()
+            return
+
+        self.tick.emit()
+
+
+_pulse_clock = None
+
+
+def _get_pulse_clock():
+    """获取共享脉冲时钟"""
+    global _pulse_clock
+    if _pulse_clock is None:
+        _pulse_clock = _PulseClock()
+    return _pulse_clock
+
+
+@lru_cache(maxsize=None)
+def _get_font(point_size, bold=False):
+    """获取共享的微软雅黑字体（首次绘制时创建，之后复用）"""
+    if bold:
+        return QFont("Microsoft YaHei", point_size, QFont.Weight.Bold)
+    return QFont("Microsoft YaHei", point_size)
+
+
+@lru_cache(maxsize=64)
+def _get_static_text(text, point_size, bold=False):
+    """获取已按字体完成排版的静态文本（避免每帧重新排版字形）"""
+    static_text = QStaticText(text)
+    static_text.setTextFormat(Qt.TextFormat.PlainText)
+    static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+    static_text.prepare(QTransform(), _get_font(point_size, bold))
+    return static_text
+
+
+def _draw_centered_static_text(painter, rect, static_text):
+    """在矩形中居中绘制静态文本"""
+    size = static_text.size()
+    painter.drawStaticText(QPointF(rect.x() + (rect.width() - size.width()) / 2,
+                                   rect.y() + (rect.height() - size.height()) / 2),
+                           static_text)
+
+
+def _generate_noise_samples(size, seed=42):
+    """生成噪点采样（像素下标数组和预乘Alpha白色像素值数组），固定种子确保一致性"""
+    randint = random.Random(seed).randint
+    indices = array('I')
+    values = array('I')
+
+    for _ in range(size * size // 2000):  # 控制噪点密度
+        x = randint(0, size - 1)
+        y = randint(0, size - 1)
+        alpha = randint(5, 15)
+        indices.append(y * size + x)
+        values.append(alpha * 0x01010101)  # 四个通道的值都等于alpha
+
+    return indices, values
+
+
+def _create_transparent_pixmap(width, height, dpr):
+    """创建按设备像素比缩放的透明位图（width/height为逻辑尺寸）"""
+    pixmap = QPixmap(int(width * dpr), int(height * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    return pixmap
+
+
+def _shadow_margins(shadows):
+    """计算容纳各状态阴影所需的边距 (左右, 上, 下)，shadows 为 (模糊, 下移, 透明度) 序列"""
+    shadows = tuple(shadows)
+    side = max(blur for blur, _, _ in shadows)
+    top = max(max(blur - offset, 2) for blur, offset, _ in shadows)
+    bottom = max(blur + offset for blur, offset, _ in shadows)
+    return side, top, bottom
+
+
+@lru_cache(maxsize=32)
+def _render_rounded_shadow(width, height, corner_radius, blur, alpha, dpr):
+    """渲染圆角矩形的柔和阴影位图（逐层向外描边、透明度递减模拟模糊）
+
+    width/height 为阴影主体的逻辑尺寸，位图四周各留出 blur 像素。
+    阴影参数只有少数几种组合，按参数缓存，绘制时直接贴图。
+    """
+    pixmap = _create_transparent_pixmap(width + blur * 2, height + blur * 2, dpr)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # 阴影主体
+    body = QRectF(blur, blur, width, height)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, alpha))
+    painter.drawRoundedRect(body, corner_radius, corner_radius)
+
+    # 向外逐像素描边，透明度按二次曲线衰减
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    for i in range(1, blur + 1):
+        ring_alpha = int(alpha * (1 - i / (blur + 1)) ** 2)
+        if ring_alpha <= 0:
+            break
+        painter.setPen(QPen(QColor(0, 0, 0, ring_alpha), 1))
+        r = i - 0.5
+        painter.drawRoundedRect(body.adjusted(-r, -r, r, r), corner_radius + r, corner_radius + r)
+
+    painter.end()
+    return pixmap
+
+
+def _draw_rounded_shadow(painter, rect, corner_radius, shadow, dpr):
+    """在 rect 下方绘制缓存的圆角阴影，shadow 为 (模糊, 下移, 透明度)"""
+    blur, offset, alpha = shadow
+    painter.drawPixmap(rect.left() - blur, rect.top() - blur + offset,
+                       _render_rounded_shadow(rect.width(), rect.height(), corner_radius, blur, alpha, dpr))
+
+
+def _create_transparent_image(width, height, dpr):
+    """创建预乘Alpha格式的透明图像（光栅引擎合成时走快速混合路径）"""
+    image = QImage(int(width * dpr), int(height * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.GlobalColor.transparent)
+    return image
 
 
 class EnhancedCircularButton(QPushButton):
     """增强版圆形按钮 - 具有磨砂玻璃效果、波纹动画和动态阴影"""
+
+    # 主按钮底图缓存上限（两种状态 × 悬停/按下动画中的各个半径）
+    BASE_IMAGE_CACHE_SIZE = 16
+    # 底图相对按钮半径的外扩边距（容纳外圈与阴影）及阴影下移量
+    SPRITE_MARGIN = 16
+    SHADOW_OFFSET = 4
+
+    # 预先构造的渐变色标和画笔 {is_listening: stops}
+    _OUTER_STOPS = {
+        True: [(0, QColor(255, 107, 107, 200)), (0.8, QColor(255, 77, 77, 150)), (1, QColor(255, 47, 47, 100))],
+        False: [(0, QColor(59, 130, 246, 200)), (0.8, QColor(37, 99, 235, 150)), (1, QColor(29, 78, 216, 100))],
+    }
+    _INNER_STOPS = {
+        True: [(0, QColor(255, 87, 87, 220)), (0.6, QColor(255, 67, 67, 180)), (1, QColor(255, 47, 47, 140))],
+        False: [(0, QColor(79, 150, 255, 220)), (0.6, QColor(59, 130, 246, 180)), (1, QColor(37, 99, 235, 140))],
+    }
+    _HIGHLIGHT_STOPS = [(0, QColor(255, 255, 255, 60)), (1, QColor(255, 255, 255, 0))]
+    _SHADOW_COLORS = {
+        True: (QColor(255, 87, 87, 100), QColor(255, 87, 87, 0)),
+        False: (QColor(59, 130, 246, 80), QColor(59, 130, 246, 0)),
+    }
+    _OUTER_PEN = QPen(QColor(255, 255, 255, 50), 2)
+    _INNER_PEN = QPen(QColor(255, 255, 255, 80), 1)
+    _PULSE_EDGE_COLOR = QColor(255, 87, 87, 0)
+    _TEXT_COLOR = QColor(255, 255, 255)
     
     def __init__(self, text="开始监听", parent=None):
         super().__init__(text, parent)
@@ -26,7 +279,10 @@ class EnhancedCircularButton(QPushButton):
         self._hover_scale = 1.0
         self._ripple_radius = 0
         self._ripple_opacity = 0
-        self._pulse_value = 0
+        self._needs_repaint = False
+
+        # 主按钮底图缓存 {(is_listening, radius, dpr): QImage}
+        self._base_image_cache = OrderedDict()
         
         # 设置基础样式
         self.setStyleSheet("""
@@ -40,12 +296,8 @@ class EnhancedCircularButton(QPushButton):
             }
         """)
         
-        # 添加阴影效果
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(20)
-        self.shadow_effect.setOffset(0, 8)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 80))
-        self.setGraphicsEffect(self.shadow_effect)
+        # 阴影直接绘制在缓存底图中，不使用 QGraphicsDropShadowEffect（避免每帧离屏合成）
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         
         # 悬停动画
         self.hover_animation = QPropertyAnimation(self, b"hover_scale")
@@ -71,20 +323,13 @@ class EnhancedCircularButton(QPushButton):
         self.ripple_animation.addAnimation(self.ripple_radius_anim)
         self.ripple_animation.addAnimation(self.ripple_opacity_anim)
         
-        # 脉冲动画（监听状态）
-        self.pulse_animation = QPropertyAnimation(self, b"pulse_value")
-        self.pulse_animation.setDuration(2000)
-        self.pulse_animation.setLoopCount(-1)  # 无限循环
-        self.pulse_animation.setKeyValueAt(0, 0)
-        self.pulse_animation.setKeyValueAt(0.5, 1)
-        self.pulse_animation.setKeyValueAt(1, 0)
-        self.pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        # 脉冲动画（监听状态，由共享脉冲时钟驱动）
+        self._pulse_subscribed = False
         
         # 属性设置
         self.setProperty("hover_scale", 1.0)
         self.setProperty("ripple_radius", 0)
         self.setProperty("ripple_opacity", 0)
-        self.setProperty("pulse_value", 0)
     
     def paintEvent(self, event):
         """自定义绘制 - 实现磨砂玻璃效果和动画"""
@@ -93,100 +338,133 @@ class EnhancedCircularButton(QPushButton):
         
         rect = self.rect()
         center = rect.center()
+        cx, cy = center.x(), center.y()
         base_radius = min(rect.width(), rect.height()) // 2 - 15  # 留出阴影空间
         
         # 应用悬停缩放
         scaled_radius = int(base_radius * self._hover_scale)
         
         # 绘制主按钮
-        self._draw_main_button(painter, center, scaled_radius)
+        self._draw_main_button(painter, cx, cy, scaled_radius)
         
-        # 绘制脉冲效果（监听状态）
-        if self.is_listening:
-            self._draw_pulse_effect(painter, center, scaled_radius)
+        # 绘制脉冲效果（监听状态，脉冲透明度 100*(1-value) 取整为0时跳过）
+        if self.is_listening and self._pulse_subscribed:
+            pulse_value = _get_pulse_clock().phase()
+            if pulse_value < 0.99:
+                self._draw_pulse_effect(painter, cx, cy, scaled_radius, pulse_value)
         
-        # 绘制波纹效果
-        if self._ripple_radius > 0:
-            self._draw_ripple_effect(painter, center)
+        # 绘制波纹效果（完全透明时跳过）
+        if self._ripple_radius > 0 and self._ripple_opacity >= 1:
+            self._draw_ripple_effect(painter, cx, cy)
         
         # 绘制文字
         self._draw_text(painter, rect)
     
-    def _draw_main_button(self, painter, center, radius):
+    def _draw_main_button(self, painter, cx, cy, radius):
+        """绘制主按钮 - 使用缓存的底图"""
+        half_size = radius + self.SPRITE_MARGIN
+        painter.drawImage(cx - half_size, cy - half_size, self._get_base_image(radius))
+
+    def _get_base_image(self, radius):
+        """获取主按钮底图（预乘Alpha格式），未命中时渲染并加入LRU缓存"""
+        dpr = self.devicePixelRatioF()
+        key = (self.is_listening, radius, dpr)
+
+        image = self._base_image_cache.get(key)
+        if image is not None:
+            self._base_image_cache.move_to_end(key)
+            return image
+
+        half_size = radius + self.SPRITE_MARGIN
+        image = _create_transparent_image(half_size * 2, half_size * 2, dpr)
+
+        image_painter = QPainter(image)
+        image_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._paint_shadow(image_painter, half_size, half_size, radius)
+        self._paint_main_button(image_painter, half_size, half_size, radius)
+        image_painter.end()
+
+        self._base_image_cache[key] = image
+        if len(self._base_image_cache) > self.BASE_IMAGE_CACHE_SIZE:
+            self._base_image_cache.popitem(last=False)
+
+        return image
+
+    def _paint_shadow(self, painter, cx, cy, radius):
+        """绘制按钮下方的柔和阴影（径向渐变模拟模糊）"""
+        shadow_radius = radius + self.SPRITE_MARGIN - self.SHADOW_OFFSET
+        color, edge_color = self._SHADOW_COLORS[self.is_listening]
+
+        shadow_gradient = QRadialGradient(cx, cy + self.SHADOW_OFFSET, shadow_radius)
+        shadow_gradient.setColorAt(0, color)
+        shadow_gradient.setColorAt((radius + 3) / shadow_radius, color)
+        shadow_gradient.setColorAt(1, edge_color)
+
+        painter.setBrush(QBrush(shadow_gradient))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(cx - shadow_radius, cy + self.SHADOW_OFFSET - shadow_radius,
+                            shadow_radius * 2, shadow_radius * 2)
+
+    def _paint_main_button(self, painter, cx, cy, radius):
         """绘制主按钮 - 磨砂玻璃效果"""
+        r = radius
+        r2 = r * 2
+        r3 = r + 3
+
         # 外圈渐变（磨砂玻璃边框）
-        outer_gradient = QRadialGradient(center.x(), center.y(), radius + 5)
-        if self.is_listening:
-            outer_gradient.setColorAt(0, QColor(255, 107, 107, 200))
-            outer_gradient.setColorAt(0.8, QColor(255, 77, 77, 150))
-            outer_gradient.setColorAt(1, QColor(255, 47, 47, 100))
-        else:
-            outer_gradient.setColorAt(0, QColor(59, 130, 246, 200))
-            outer_gradient.setColorAt(0.8, QColor(37, 99, 235, 150))
-            outer_gradient.setColorAt(1, QColor(29, 78, 216, 100))
+        outer_gradient = QRadialGradient(cx, cy, r + 5)
+        outer_gradient.setStops(self._OUTER_STOPS[self.is_listening])
         
         painter.setBrush(QBrush(outer_gradient))
-        painter.setPen(QPen(QColor(255, 255, 255, 50), 2))
-        painter.drawEllipse(center.x() - radius - 3, center.y() - radius - 3, 
-                          (radius + 3) * 2, (radius + 3) * 2)
+        painter.setPen(self._OUTER_PEN)
+        painter.drawEllipse(cx - r3, cy - r3, r2 + 6, r2 + 6)
         
         # 内圈主体（磨砂玻璃效果）
-        inner_gradient = QRadialGradient(center.x(), center.y(), radius)
-        if self.is_listening:
-            inner_gradient.setColorAt(0, QColor(255, 87, 87, 220))
-            inner_gradient.setColorAt(0.6, QColor(255, 67, 67, 180))
-            inner_gradient.setColorAt(1, QColor(255, 47, 47, 140))
-        else:
-            inner_gradient.setColorAt(0, QColor(79, 150, 255, 220))
-            inner_gradient.setColorAt(0.6, QColor(59, 130, 246, 180))
-            inner_gradient.setColorAt(1, QColor(37, 99, 235, 140))
+        inner_gradient = QRadialGradient(cx, cy, r)
+        inner_gradient.setStops(self._INNER_STOPS[self.is_listening])
         
         painter.setBrush(QBrush(inner_gradient))
-        painter.setPen(QPen(QColor(255, 255, 255, 80), 1))
-        painter.drawEllipse(center.x() - radius, center.y() - radius, 
-                          radius * 2, radius * 2)
+        painter.setPen(self._INNER_PEN)
+        painter.drawEllipse(cx - r, cy - r, r2, r2)
         
         # 高光效果
-        highlight_gradient = QRadialGradient(
-            center.x() - radius // 3, center.y() - radius // 3, radius // 2
-        )
-        highlight_gradient.setColorAt(0, QColor(255, 255, 255, 60))
-        highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        highlight_gradient = QRadialGradient(cx - r // 3, cy - r // 3, r // 2)
+        highlight_gradient.setStops(self._HIGHLIGHT_STOPS)
         
         painter.setBrush(QBrush(highlight_gradient))
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(center.x() - radius, center.y() - radius, 
-                          radius * 2, radius * 2)
+        painter.drawEllipse(cx - r, cy - r, r2, r2)
     
-    def _draw_pulse_effect(self, painter, center, radius):
+    def _draw_pulse_effect(self, painter, cx, cy, radius, pulse_value):
         """绘制脉冲效果"""
-        pulse_radius = radius + int(20 * self._pulse_value)
-        pulse_opacity = int(100 * (1 - self._pulse_value))
+        pulse_radius = radius + int(20 * pulse_value)
+        pulse_opacity = int(100 * (1 - pulse_value))
         
-        pulse_gradient = QRadialGradient(center.x(), center.y(), pulse_radius)
-        pulse_gradient.setColorAt(0, QColor(255, 87, 87, 0))
+        pulse_gradient = QRadialGradient(cx, cy, pulse_radius)
+        pulse_gradient.setColorAt(0, self._PULSE_EDGE_COLOR)
         pulse_gradient.setColorAt(0.8, QColor(255, 87, 87, pulse_opacity))
-        pulse_gradient.setColorAt(1, QColor(255, 87, 87, 0))
+        pulse_gradient.setColorAt(1, self._PULSE_EDGE_COLOR)
         
         painter.setBrush(QBrush(pulse_gradient))
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(center.x() - pulse_radius, center.y() - pulse_radius,
+        painter.drawEllipse(cx - pulse_radius, cy - pulse_radius,
                           pulse_radius * 2, pulse_radius * 2)
     
-    def _draw_ripple_effect(self, painter, center):
+    def _draw_ripple_effect(self, painter, cx, cy):
         """绘制波纹效果"""
+        ripple_radius = self._ripple_radius
         ripple_color = QColor(255, 255, 255, int(self._ripple_opacity))
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.setPen(QPen(ripple_color, 3))
-        painter.drawEllipse(int(center.x() - self._ripple_radius), int(center.y() - self._ripple_radius),
-                          int(self._ripple_radius * 2), int(self._ripple_radius * 2))
+        painter.drawEllipse(int(cx - ripple_radius), int(cy - ripple_radius),
+                          int(ripple_radius * 2), int(ripple_radius * 2))
     
     def _draw_text(self, painter, rect):
         """绘制文字"""
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Microsoft YaHei", 12, QFont.Weight.Bold))
+        painter.setPen(self._TEXT_COLOR)
+        painter.setFont(_get_font(12, bold=True))
         text = "停止监听" if self.is_listening else "开始监听"
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        _draw_centered_static_text(painter, rect, _get_static_text(text, 12, bold=True))
     
     def enterEvent(self, event):
         """鼠标进入事件"""
@@ -250,16 +528,29 @@ class EnhancedCircularButton(QPushButton):
         self.is_listening = is_listening
         
         if is_listening:
-            self.pulse_animation.start()
-            # 更新阴影颜色为红色
-            self.shadow_effect.setColor(QColor(255, 87, 87, 100))
+            # 阴影颜色随底图切换为红色
+            self._start_pulse()
         else:
-            self.pulse_animation.stop()
-            self._pulse_value = 0
-            # 恢复蓝色阴影
-            self.shadow_effect.setColor(QColor(59, 130, 246, 80))
+            # 阴影颜色随底图恢复为蓝色
+            self._stop_pulse()
         
         self.update()
+
+    def _start_pulse(self):
+        """订阅共享脉冲时钟"""
+        if not self._pulse_subscribed:
+            _get_pulse_clock().subscribe(self._on_pulse_tick)
+            self._pulse_subscribed = True
+
+    def _stop_pulse(self):
+        """取消订阅共享脉冲时钟"""
+        if self._pulse_subscribed:
+            _get_pulse_clock().unsubscribe(self._on_pulse_tick)
+            self._pulse_subscribed = False
+
+    def _on_pulse_tick(self):
+        """共享脉冲时钟回调"""
+        _schedule_repaint(self)
     
     # PyQt6属性定义
     @pyqtProperty(float)
@@ -269,7 +560,7 @@ class EnhancedCircularButton(QPushButton):
     @hover_scale.setter
     def hover_scale(self, value):
         self._hover_scale = value
-        self.update()
+        _schedule_repaint(self)
 
     @pyqtProperty(float)
     def ripple_radius(self):
@@ -278,7 +569,7 @@ class EnhancedCircularButton(QPushButton):
     @ripple_radius.setter
     def ripple_radius(self, value):
         self._ripple_radius = value
-        self.update()
+        _schedule_repaint(self)
 
     @pyqtProperty(float)
     def ripple_opacity(self):
@@ -287,16 +578,7 @@ class EnhancedCircularButton(QPushButton):
     @ripple_opacity.setter
     def ripple_opacity(self, value):
         self._ripple_opacity = value
-        self.update()
-
-    @pyqtProperty(float)
-    def pulse_value(self):
-        return self._pulse_value
-
-    @pulse_value.setter
-    def pulse_value(self, value):
-        self._pulse_value = value
-        self.update()
+        _schedule_repaint(self)
 
 
 class EnhancedStatusIndicator(QWidget):
@@ -304,6 +586,36 @@ class EnhancedStatusIndicator(QWidget):
 
     clicked = pyqtSignal()
 
+    # 预先构造的颜色、渐变色标和画笔
+    _BACKGROUND_STOPS = [(0, QColor(45, 55, 72, 200)), (0.5, QColor(30, 41, 59, 180)), (1, QColor(15, 23, 42, 160))]
+    _BACKGROUND_PEN = QPen(QColor(74, 85, 104, 150), 1)
+    _HIGHLIGHT_STOPS = [(0, QColor(255, 255, 255, 40)), (1, QColor(255, 255, 255, 0))]
+    _INDICATOR_PEN = QPen(QColor(255, 255, 255, 50), 1)
+    _PULSE_EDGE_COLOR = QColor(34, 197, 94, 0)
+    # 指示灯渐变色标 {状态: stops}，状态为 blink_on / active / inactive
+    _INDICATOR_STOPS = {
+        state: [(0, color), (0.7, color.darker(120)), (1, color.darker(150))]
+        for state, color in (
+            ('blink_on', QColor(34, 197, 94, 255)),
+            ('active', QColor(22, 163, 74, 220)),
+            ('inactive', QColor(156, 163, 175, 180)),
+        )
+    }
+    _TITLE_COLOR = QColor(241, 245, 249)
+    _SUBTITLE_COLOR = QColor(156, 163, 175)
+    # 边框发光画笔 {is_active: (内层, 中层, 外层)}，透明度逐层减半
+    _GLOW_PENS = {
+        True: tuple(QPen(QColor(34, 197, 94, alpha), 1) for alpha in (100, 50, 25)),
+        False: tuple(QPen(QColor(156, 163, 175, alpha), 1) for alpha in (50, 25, 12)),
+    }
+
+    # 发光位图四周留白（发光最多向外扩展2px，加上画笔宽度）
+    GLOW_PADDING = 3
+
+    # 卡片阴影 {悬停: (模糊, 下移, 透明度)}，绘制在控件四周预留的边距内
+    _SHADOWS = {False: (5, 3, 60), True: (7, 5, 60)}
+    SHADOW_MARGINS = _shadow_margins(_SHADOWS.values())
+
     def __init__(self, title, subtitle="", parent=None):
         super().__init__(parent)
         self.title = title
@@ -312,17 +624,23 @@ class EnhancedStatusIndicator(QWidget):
         self.is_blinking = False
         self.blink_state = False
         self._hover_elevation = 0
-        self._pulse_value = 0
+        self._needs_repaint = False
+
+        # 静态层缓存（背景和文字），尺寸或副标题变化时重建
+        self._cached_bg = None
 
-        self.setFixedSize(220, 90)
+        # 边框发光位图缓存，尺寸或活跃状态变化时重建
+        self._glow_pixmap = None
+        self._glow_pixmap_key = None
+
+        # 卡片本体 216x86，四周加上阴影边距
+        side, top, bottom = self.SHADOW_MARGINS
+        self.setFixedSize(216 + side * 2, 86 + top + bottom)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # 添加阴影效果
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(15)
-        self.shadow_effect.setOffset(0, 4)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 60))
-        self.setGraphicsEffect(self.shadow_effect)
+        # 阴影由缓存位图绘制，不使用 QGraphicsDropShadowEffect（避免每帧离屏合成）
+        # 圆角外区域透明，告知Qt无需预先填充背景
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
 
         # 悬停动画
         self.hover_animation = QPropertyAnimation(self, b"hover_elevation")
@@ -333,70 +651,105 @@ class EnhancedStatusIndicator(QWidget):
         self.blink_timer = QTimer()
         self.blink_timer.timeout.connect(self.toggle_blink)
 
-        # 脉冲动画（指示灯）
-        self.pulse_animation = QPropertyAnimation(self, b"pulse_value")
-        self.pulse_animation.setDuration(2000)
-        self.pulse_animation.setLoopCount(-1)
-        self.pulse_animation.setKeyValueAt(0, 0)
-        self.pulse_animation.setKeyValueAt(0.5, 1)
-        self.pulse_animation.setKeyValueAt(1, 0)
-        self.pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        # 脉冲动画（指示灯，由共享脉冲时钟驱动）
+        self._pulse_subscribed = False
 
         self.setProperty("hover_elevation", 0)
-        self.setProperty("pulse_value", 0)
 
     def paintEvent(self, event):
         """自定义绘制 - 磨砂玻璃卡片效果"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        rect = self.rect().adjusted(2, 2, -2, -2)  # 为阴影留出空间
+        side, top, bottom = self.SHADOW_MARGINS
+        rect = self.rect().adjusted(side, top, -side, -bottom)  # 为阴影留出空间
 
-        # 绘制磨砂玻璃背景
-        self._draw_glass_background(painter, rect)
+        # 绘制缓存的阴影（悬停时抬高）
+        _draw_rounded_shadow(painter, rect, 12, self._SHADOWS[self.underMouse()], self.devicePixelRatioF())
+
+        # 绘制缓存的磨砂玻璃背景和文字内容（位图贴图无需抗锯齿）
+        painter.drawPixmap(0, 0, self._get_cached_bg(rect))
 
         # 绘制边框发光效果
         if self.is_active:
             self._draw_border_glow(painter, rect)
 
-        # 绘制状态指示灯
+        # 绘制状态指示灯（仅圆形指示灯需要抗锯齿）
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         self._draw_status_indicator(painter, rect)
 
-        # 绘制文字内容
-        self._draw_text_content(painter, rect)
+    def resizeEvent(self, event):
+        """尺寸变化时重建静态层"""
+        self._cached_bg = None
+        self._glow_pixmap = None
+        super().resizeEvent(event)
+
+    def _get_cached_bg(self, rect):
+        """获取静态层（背景和文字），必要时重新渲染"""
+        dpr = self.devicePixelRatioF()
+        if self._cached_bg is None or self._cached_bg.devicePixelRatio() != dpr:
+            pixmap = _create_transparent_pixmap(self.width(), self.height(), dpr)
+
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_glass_background(pixmap_painter, rect)
+            self._draw_text_content(pixmap_painter, rect)
+            pixmap_painter.end()
+
+            self._cached_bg = pixmap
+
+        return self._cached_bg
 
     def _draw_glass_background(self, painter, rect):
         """绘制磨砂玻璃背景"""
         # 主背景渐变
         background_gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
-        background_gradient.setColorAt(0, QColor(45, 55, 72, 200))
-        background_gradient.setColorAt(0.5, QColor(30, 41, 59, 180))
-        background_gradient.setColorAt(1, QColor(15, 23, 42, 160))
+        background_gradient.setStops(self._BACKGROUND_STOPS)
 
         painter.setBrush(QBrush(background_gradient))
-        painter.setPen(QPen(QColor(74, 85, 104, 150), 1))
+        painter.setPen(self._BACKGROUND_PEN)
         painter.drawRoundedRect(rect, 12, 12)
 
         # 高光效果
         highlight_rect = rect.adjusted(1, 1, -1, -rect.height()//2)
         highlight_gradient = QLinearGradient(0, highlight_rect.top(), 0, highlight_rect.bottom())
-        highlight_gradient.setColorAt(0, QColor(255, 255, 255, 40))
-        highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        highlight_gradient.setStops(self._HIGHLIGHT_STOPS)
 
         painter.setBrush(QBrush(highlight_gradient))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(highlight_rect, 11, 11)
 
     def _draw_border_glow(self, painter, rect):
+        """绘制边框发光效果 - 使用缓存的发光位图"""
+        padding = self.GLOW_PADDING
+        painter.drawPixmap(rect.left() - padding, rect.top() - padding, self._get_glow_pixmap(rect))
+
+    def _get_glow_pixmap(self, rect):
+        """获取边框发光位图，必要时重新渲染"""
+        dpr = self.devicePixelRatioF()
+        key = (self.is_active, rect.width(), rect.height(), dpr)
+
+        if self._glow_pixmap is None or self._glow_pixmap_key != key:
+            padding = self.GLOW_PADDING
+            pixmap = _create_transparent_pixmap(rect.width() + padding * 2,
+                                                rect.height() + padding * 2, dpr)
+
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._paint_border_glow(pixmap_painter, QRect(padding, padding, rect.width(), rect.height()))
+            pixmap_painter.end()
+
+            self._glow_pixmap = pixmap
+            self._glow_pixmap_key = key
+
+        return self._glow_pixmap
+
+    def _paint_border_glow(self, painter, rect):
         """绘制边框发光效果"""
-        glow_color = QColor(34, 197, 94, 100) if self.is_active else QColor(156, 163, 175, 50)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
 
-        for i in range(3):
-            glow_rect = rect.adjusted(-i, -i, i, i)
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.setPen(QPen(glow_color, 1))
-            painter.drawRoundedRect(glow_rect, 12 + i, 12 + i)
-            glow_color.setAlpha(glow_color.alpha() // 2)
+        for i, pen in enumerate(self._GLOW_PENS[self.is_active]):
+            painter.setPen(pen)
+            painter.drawRoundedRect(rect.adjusted(-i, -i, i, i), 12 + i, 12 + i)
 
     def _draw_status_indicator(self, painter, rect):
         """绘制状态指示灯"""
@@ -406,18 +759,19 @@ class EnhancedStatusIndicator(QWidget):
         if self.is_active:
             # 活跃状态 - 绿色指示灯
             if self.is_blinking and self.blink_state:
-                indicator_color = QColor(34, 197, 94, 255)
+                indicator_stops = self._INDICATOR_STOPS['blink_on']
             else:
-                indicator_color = QColor(22, 163, 74, 220)
+                indicator_stops = self._INDICATOR_STOPS['active']
 
-            # 脉冲效果
-            if self._pulse_value > 0:
-                pulse_radius = base_radius + int(6 * self._pulse_value)
-                pulse_opacity = int(80 * (1 - self._pulse_value))
+            # 脉冲效果（透明度 80*(1-value) 取整为0时跳过）
+            pulse_value = _get_pulse_clock().phase() if self._pulse_subscribed else 0
+            if 0 < pulse_value < 0.98:
+                pulse_radius = base_radius + int(6 * pulse_value)
+                pulse_opacity = int(80 * (1 - pulse_value))
                 pulse_gradient = QRadialGradient(indicator_center.x(), indicator_center.y(), pulse_radius)
-                pulse_gradient.setColorAt(0, QColor(34, 197, 94, 0))
+                pulse_gradient.setColorAt(0, self._PULSE_EDGE_COLOR)
                 pulse_gradient.setColorAt(0.7, QColor(34, 197, 94, pulse_opacity))
-                pulse_gradient.setColorAt(1, QColor(34, 197, 94, 0))
+                pulse_gradient.setColorAt(1, self._PULSE_EDGE_COLOR)
 
                 painter.setBrush(QBrush(pulse_gradient))
                 painter.setPen(Qt.PenStyle.NoPen)
@@ -426,16 +780,14 @@ class EnhancedStatusIndicator(QWidget):
                                   pulse_radius * 2, pulse_radius * 2)
         else:
             # 非活跃状态 - 灰色指示灯
-            indicator_color = QColor(156, 163, 175, 180)
+            indicator_stops = self._INDICATOR_STOPS['inactive']
 
         # 绘制主指示灯
         indicator_gradient = QRadialGradient(indicator_center.x(), indicator_center.y(), base_radius)
-        indicator_gradient.setColorAt(0, indicator_color)
-        indicator_gradient.setColorAt(0.7, indicator_color.darker(120))
-        indicator_gradient.setColorAt(1, indicator_color.darker(150))
+        indicator_gradient.setStops(indicator_stops)
 
         painter.setBrush(QBrush(indicator_gradient))
-        painter.setPen(QPen(QColor(255, 255, 255, 50), 1))
+        painter.setPen(self._INDICATOR_PEN)
         painter.drawEllipse(indicator_center.x() - base_radius,
                           indicator_center.y() - base_radius,
                           base_radius * 2, base_radius * 2)
@@ -443,14 +795,14 @@ class EnhancedStatusIndicator(QWidget):
     def _draw_text_content(self, painter, rect):
         """绘制文字内容"""
         # 绘制标题
-        painter.setPen(QColor(241, 245, 249))
-        painter.setFont(QFont("Microsoft YaHei", 11, QFont.Weight.Bold))
+        painter.setPen(self._TITLE_COLOR)
+        painter.setFont(_get_font(11, bold=True))
         title_rect = QRect(rect.left() + 45, rect.top() + 12, rect.width() - 55, 25)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self.title)
 
         # 绘制副标题
-        painter.setPen(QColor(156, 163, 175))
-        painter.setFont(QFont("Microsoft YaHei", 9))
+        painter.setPen(self._SUBTITLE_COLOR)
+        painter.setFont(_get_font(9))
         subtitle_rect = QRect(rect.left() + 45, rect.top() + 35, rect.width() - 55, 45)
         painter.drawText(subtitle_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, self.subtitle)
 
@@ -460,9 +812,8 @@ class EnhancedStatusIndicator(QWidget):
         self.hover_animation.setEndValue(8)
         self.hover_animation.start()
 
-        # 更新阴影效果
-        self.shadow_effect.setOffset(0, 8)
-        self.shadow_effect.setBlurRadius(20)
+        # 重绘以切换到悬停阴影
+        self.update()
         super().enterEvent(event)
 
     def leaveEvent(self, event):
@@ -471,9 +822,8 @@ class EnhancedStatusIndicator(QWidget):
         self.hover_animation.setEndValue(0)
         self.hover_animation.start()
 
-        # 恢复阴影效果
-        self.shadow_effect.setOffset(0, 4)
-        self.shadow_effect.setBlurRadius(15)
+        # 重绘以恢复普通阴影
+        self.update()
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
@@ -489,18 +839,34 @@ class EnhancedStatusIndicator(QWidget):
 
         if blinking and active:
             self.blink_timer.start(500)
-            self.pulse_animation.start()
+            self._start_pulse()
         else:
             self.blink_timer.stop()
-            self.pulse_animation.stop()
+            self._stop_pulse()
             self.blink_state = False
-            self._pulse_value = 0
 
         self.update()
 
+    def _start_pulse(self):
+        """订阅共享脉冲时钟"""
+        if not self._pulse_subscribed:
+            _get_pulse_clock().subscribe(self._on_pulse_tick)
+            self._pulse_subscribed = True
+
+    def _stop_pulse(self):
+        """取消订阅共享脉冲时钟"""
+        if self._pulse_subscribed:
+            _get_pulse_clock().unsubscribe(self._on_pulse_tick)
+            self._pulse_subscribed = False
+
+    def _on_pulse_tick(self):
+        """共享脉冲时钟回调"""
+        _schedule_repaint(self)
+
     def set_subtitle(self, subtitle: str):
         """设置副标题"""
         self.subtitle = subtitle
+        self._cached_bg = None
         self.update()
 
     def toggle_blink(self):
@@ -516,21 +882,26 @@ class EnhancedStatusIndicator(QWidget):
     @hover_elevation.setter
     def hover_elevation(self, value):
         self._hover_elevation = value
-        self.update()
-
-    @pyqtProperty(float)
-    def pulse_value(self):
-        return self._pulse_value
-
-    @pulse_value.setter
-    def pulse_value(self, value):
-        self._pulse_value = value
-        self.update()
+        _schedule_repaint(self)
 
 
 class EnhancedStatCard(QWidget):
     """增强版统计卡片 - 悬停上浮效果和数字动画"""
 
+    # 预先构造的颜色、渐变色标和画笔
+    _BACKGROUND_STOPS = [(0, QColor(30, 41, 59, 200)), (0.5, QColor(51, 65, 85, 180)), (1, QColor(71, 85, 105, 160))]
+    _BACKGROUND_PEN = QPen(QColor(100, 116, 139, 120), 1)
+    _HIGHLIGHT_STOPS = [(0, QColor(255, 255, 255, 30)), (1, QColor(255, 255, 255, 0))]
+    _VALUE_STOPS = [(0, QColor(59, 130, 246)), (1, QColor(37, 99, 235))]
+    _TITLE_COLOR = QColor(156, 163, 175)
+
+    # 数值基础字号（缩放动画中为 20~24）
+    VALUE_FONT_SIZE = 20
+
+    # 卡片阴影 {悬停: (模糊, 下移, 透明度)}，绘制在控件四周预留的边距内
+    _SHADOWS = {False: (4, 2, 40), True: (6, 3, 40)}
+    SHADOW_MARGINS = _shadow_margins(_SHADOWS.values())
+
     def __init__(self, title, value=0, parent=None):
         super().__init__(parent)
         self.title = title
@@ -538,16 +909,19 @@ class EnhancedStatCard(QWidget):
         self.target_value = value
         self._hover_elevation = 0
         self._number_scale = 1.0
+        self._needs_repaint = False
+
+        # 静态层缓存（背景和标题），尺寸变化时重建
+        self._cached_bg = None
 
-        self.setFixedSize(130, 70)
+        # 卡片本体 128x68，四周加上阴影边距
+        side, top, bottom = self.SHADOW_MARGINS
+        self.setFixedSize(128 + side * 2, 68 + top + bottom)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # 添加阴影效果
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(10)
-        self.shadow_effect.setOffset(0, 2)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 40))
-        self.setGraphicsEffect(self.shadow_effect)
+        # 阴影由缓存位图绘制，不使用 QGraphicsDropShadowEffect（避免每帧离屏合成）
+        # 圆角外区域透明，告知Qt无需预先填充背景
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
 
         # 悬停动画
         self.hover_animation = QPropertyAnimation(self, b"hover_elevation")
@@ -559,10 +933,21 @@ class EnhancedStatCard(QWidget):
         self.value_animation.setDuration(800)
         self.value_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # 数字缩放动画
-        self.scale_animation = QPropertyAnimation(self, b"number_scale")
-        self.scale_animation.setDuration(300)
-        self.scale_animation.setEasingCurve(QEasingCurve.Type.OutBack)
+        # 数字缩放动画（放大后缩回，顺序动画组只构建一次）
+        self.scale_up_animation = QPropertyAnimation(self, b"number_scale")
+        self.scale_up_animation.setDuration(300)
+        self.scale_up_animation.setEasingCurve(QEasingCurve.Type.OutBack)
+        self.scale_up_animation.setEndValue(1.2)  # 起始值取启动时的当前缩放
+
+        self.scale_down_animation = QPropertyAnimation(self, b"number_scale")
+        self.scale_down_animation.setDuration(300)
+        self.scale_down_animation.setEasingCurve(QEasingCurve.Type.OutBack)
+        self.scale_down_animation.setStartValue(1.2)
+        self.scale_down_animation.setEndValue(1.0)
+
+        self.scale_animation = QSequentialAnimationGroup(self)
+        self.scale_animation.addAnimation(self.scale_up_animation)
+        self.scale_animation.addAnimation(self.scale_down_animation)
 
         self.setProperty("hover_elevation", 0)
         self.setProperty("current_value", value)
@@ -571,69 +956,93 @@ class EnhancedStatCard(QWidget):
     def paintEvent(self, event):
         """自定义绘制 - 磨砂玻璃卡片"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        rect = self.rect().adjusted(1, 1, -1, -1)
+        side, top, bottom = self.SHADOW_MARGINS
+        rect = self.rect().adjusted(side, top, -side, -bottom)  # 为阴影留出空间
+
+        # 绘制缓存的阴影（悬停时抬高）
+        _draw_rounded_shadow(painter, rect, 8, self._SHADOWS[self.underMouse()], self.devicePixelRatioF())
 
-        # 绘制磨砂玻璃背景
-        self._draw_glass_background(painter, rect)
+        # 绘制缓存的磨砂玻璃背景和标题（位图贴图无需抗锯齿）
+        painter.drawPixmap(0, 0, self._get_cached_bg(rect))
 
         # 绘制数值
         self._draw_value(painter, rect)
 
-        # 绘制标题
-        self._draw_title(painter, rect)
+    def resizeEvent(self, event):
+        """尺寸变化时重建静态层"""
+        self._cached_bg = None
+        super().resizeEvent(event)
+
+    def _get_cached_bg(self, rect):
+        """获取静态层（背景和标题），必要时重新渲染"""
+        dpr = self.devicePixelRatioF()
+        if self._cached_bg is None or self._cached_bg.devicePixelRatio() != dpr:
+            pixmap = _create_transparent_pixmap(self.width(), self.height(), dpr)
+
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._draw_glass_background(pixmap_painter, rect)
+            self._draw_title(pixmap_painter, rect)
+            pixmap_painter.end()
+
+            self._cached_bg = pixmap
+
+        return self._cached_bg
 
     def _draw_glass_background(self, painter, rect):
         """绘制磨砂玻璃背景"""
         # 主背景渐变
         background_gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
-        background_gradient.setColorAt(0, QColor(30, 41, 59, 200))
-        background_gradient.setColorAt(0.5, QColor(51, 65, 85, 180))
-        background_gradient.setColorAt(1, QColor(71, 85, 105, 160))
+        background_gradient.setStops(self._BACKGROUND_STOPS)
 
         painter.setBrush(QBrush(background_gradient))
-        painter.setPen(QPen(QColor(100, 116, 139, 120), 1))
+        painter.setPen(self._BACKGROUND_PEN)
         painter.drawRoundedRect(rect, 8, 8)
 
         # 高光效果
         highlight_rect = rect.adjusted(1, 1, -1, -rect.height()//2)
         highlight_gradient = QLinearGradient(0, highlight_rect.top(), 0, highlight_rect.bottom())
-        highlight_gradient.setColorAt(0, QColor(255, 255, 255, 30))
-        highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        highlight_gradient.setStops(self._HIGHLIGHT_STOPS)
 
         painter.setBrush(QBrush(highlight_gradient))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(highlight_rect, 7, 7)
 
     def _draw_value(self, painter, rect):
-        """绘制数值 - 带缩放效果"""
-        painter.save()
+        """绘制数值 - 通过字号实现缩放效果，使用缓存的数字位图"""
+        pixmap = self._render_number_pixmap(
+            str(int(self._current_value)),
+            int(self.VALUE_FONT_SIZE * self._number_scale),
+            rect.width(), 35, self.devicePixelRatioF()
+        )
+        painter.drawPixmap(rect.left(), rect.top() + 8, pixmap)
 
-        # 应用缩放变换
-        center = rect.center()
-        painter.translate(center)
-        painter.scale(self._number_scale, self._number_scale)
-        painter.translate(-center)
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _render_number_pixmap(cls, text, point_size, width, height, dpr):
+        """将数值文本渲染为透明位图（数值动画中相邻帧的整数值常相同，缓存命中率高）"""
+        pixmap = _create_transparent_pixmap(width, height, dpr)
 
-        # 数值渐变色
-        value_gradient = QLinearGradient(0, rect.top(), 0, rect.top() + 30)
-        value_gradient.setColorAt(0, QColor(59, 130, 246))
-        value_gradient.setColorAt(1, QColor(37, 99, 235))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        painter.setPen(QPen(QBrush(value_gradient), 1))
-        painter.setFont(QFont("Microsoft YaHei", 20, QFont.Weight.Bold))
+        # 数值渐变色（位图位于卡片顶部下方8px处）
+        value_gradient = QLinearGradient(0, -8, 0, 22)
+        value_gradient.setStops(cls._VALUE_STOPS)
 
-        value_rect = QRect(0, rect.top() + 8, rect.width(), 35)
-        painter.drawText(value_rect, Qt.AlignmentFlag.AlignCenter, str(int(self._current_value)))
+        painter.setPen(QPen(QBrush(value_gradient), 1))
+        painter.setFont(_get_font(point_size, bold=True))
+        painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
 
-        painter.restore()
+        return pixmap
 
     def _draw_title(self, painter, rect):
         """绘制标题"""
-        painter.setPen(QColor(156, 163, 175))
-        painter.setFont(QFont("Microsoft YaHei", 9))
-        title_rect = QRect(0, rect.top() + 48, rect.width(), 20)
+        painter.setPen(self._TITLE_COLOR)
+        painter.setFont(_get_font(9))
+        title_rect = QRect(rect.left(), rect.top() + 48, rect.width(), 20)
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
 
     def enterEvent(self, event):
@@ -642,9 +1051,8 @@ class EnhancedStatCard(QWidget):
         self.hover_animation.setEndValue(6)
         self.hover_animation.start()
 
-        # 更新阴影效果
-        self.shadow_effect.setOffset(0, 6)
-        self.shadow_effect.setBlurRadius(15)
+        # 重绘以切换到悬停阴影
+        self.update()
         super().enterEvent(event)
 
     def leaveEvent(self, event):
@@ -653,9 +1061,8 @@ class EnhancedStatCard(QWidget):
         self.hover_animation.setEndValue(0)
         self.hover_animation.start()
 
-        # 恢复阴影效果
-        self.shadow_effect.setOffset(0, 2)
-        self.shadow_effect.setBlurRadius(10)
+        # 重绘以恢复普通阴影
+        self.update()
         super().leaveEvent(event)
 
     def set_value(self, value):
@@ -668,19 +1075,10 @@ class EnhancedStatCard(QWidget):
             self.value_animation.setEndValue(value)
             self.value_animation.start()
 
-            # 数字缩放动画
-            self.scale_animation.setStartValue(1.0)
-            self.scale_animation.setEndValue(1.2)
-            self.scale_animation.finished.connect(self._scale_back)
+            # 数字缩放动画（连续更新时重新开始，不会叠加回调）
+            self.scale_animation.stop()
             self.scale_animation.start()
 
-    def _scale_back(self):
-        """缩放回原大小"""
-        self.scale_animation.finished.disconnect()
-        self.scale_animation.setStartValue(1.2)
-        self.scale_animation.setEndValue(1.0)
-        self.scale_animation.start()
-
     # PyQt6属性定义
     @pyqtProperty(float)
     def hover_elevation(self):
@@ -689,7 +1087,7 @@ class EnhancedStatCard(QWidget):
     @hover_elevation.setter
     def hover_elevation(self, value):
         self._hover_elevation = value
-        self.update()
+        _schedule_repaint(self)
 
     @pyqtProperty(float)
     def current_value(self):
@@ -698,7 +1096,7 @@ class EnhancedStatCard(QWidget):
     @current_value.setter
     def current_value(self, value):
         self._current_value = value
-        self.update()
+        _schedule_repaint(self)
 
     @pyqtProperty(float)
     def number_scale(self):
@@ -707,15 +1105,31 @@ class EnhancedStatCard(QWidget):
     @number_scale.setter
     def number_scale(self, value):
         self._number_scale = value
-        self.update()
+        _schedule_repaint(self)
 
 
 class EnhancedButton(QPushButton):
     """增强版按钮 - 渐变背景和悬停动画"""
 
+    # 背景位图缓存上限（悬停动画过程中的各级颜色）
+    BG_PIXMAP_CACHE_SIZE = 32
+
+    # 按钮阴影 {悬停: (模糊, 下移, 透明度)}，绘制在按钮四周预留的边距内
+    _SHADOWS = {False: (4, 2, 50), True: (6, 3, 50)}
+    SHADOW_MARGINS = _shadow_margins(_SHADOWS.values())
+
+    # 预先构造的颜色
+    _BASE_COLOR = QColor(107, 114, 128)  # 基础灰色
+    _TEXT_COLOR = QColor(255, 255, 255)
+    _HIGHLIGHT_END_COLOR = QColor(255, 255, 255, 0)
+
     def __init__(self, text="按钮", parent=None):
         super().__init__(text, parent)
         self._hover_intensity = 0
+        self._needs_repaint = False
+
+        # 背景位图缓存 {(lighter, darker, pen_alpha, highlight_alpha, w, h, dpr): QPixmap}
+        self._bg_pixmap_cache = OrderedDict()
 
         # 基础样式
         self.setStyleSheet("""
@@ -731,12 +1145,8 @@ class EnhancedButton(QPushButton):
             }
         """)
 
-        # 添加阴影效果
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(8)
-        self.shadow_effect.setOffset(0, 2)
-        self.shadow_effect.setColor(QColor(0, 0, 0, 50))
-        self.setGraphicsEffect(self.shadow_effect)
+        # 阴影由缓存位图绘制，不使用 QGraphicsDropShadowEffect（避免每帧离屏合成）
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
 
         # 悬停动画
         self.hover_animation = QPropertyAnimation(self, b"hover_intensity")
@@ -748,51 +1158,95 @@ class EnhancedButton(QPushButton):
     def paintEvent(self, event):
         """自定义绘制 - 渐变背景"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        rect = self.rect()
+        side, top, bottom = self.SHADOW_MARGINS
+        rect = self.rect().adjusted(side, top, -side, -bottom)  # 为阴影留出空间
 
-        # 背景渐变
-        background_gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
-        base_color = QColor(107, 114, 128)  # 基础灰色
+        # 绘制缓存的阴影（悬停时加深）
+        _draw_rounded_shadow(painter, rect, 8, self._SHADOWS[self.underMouse()], self.devicePixelRatioF())
 
-        # 根据悬停强度调整颜色
+        # 绘制缓存的背景和高光
+        painter.drawPixmap(0, 0, self._get_bg_pixmap(rect))
+
+        # 绘制文字
+        painter.setPen(self._TEXT_COLOR)
+        painter.setFont(_get_font(14, bold=True))
+        _draw_centered_static_text(painter, rect, _get_static_text(self.text(), 14, bold=True))
+
+    def sizeHint(self):
+        """在样式计算的尺寸外加上阴影边距"""
+        side, top, bottom = self.SHADOW_MARGINS
+        return super().sizeHint().grownBy(QMargins(side, top, side, bottom))
+
+    def minimumSizeHint(self):
+        """在样式计算的最小尺寸外加上阴影边距"""
+        side, top, bottom = self.SHADOW_MARGINS
+        return super().minimumSizeHint().grownBy(QMargins(side, top, side, bottom))
+
+    def resizeEvent(self, event):
+        """尺寸变化时清空背景位图缓存"""
+        self._bg_pixmap_cache.clear()
+        super().resizeEvent(event)
+
+    def _get_bg_pixmap(self, rect):
+        """获取当前悬停强度对应的背景位图，未命中时渲染并加入LRU缓存"""
+        # 根据悬停强度计算颜色参数（均为整数，动画过程中只有少量取值）
         hover_factor = self._hover_intensity / 100.0
-        lighter_color = base_color.lighter(int(120 + 30 * hover_factor))
-        darker_color = base_color.darker(int(110 + 20 * hover_factor))
+        lighter = int(120 + 30 * hover_factor)
+        darker = int(110 + 20 * hover_factor)
+        pen_alpha = int(30 + 20 * hover_factor)
+        highlight_alpha = int(20 * hover_factor)
+
+        dpr = self.devicePixelRatioF()
+        key = (lighter, darker, pen_alpha, highlight_alpha, rect.width(), rect.height(), dpr)
+
+        pixmap = self._bg_pixmap_cache.get(key)
+        if pixmap is not None:
+            self._bg_pixmap_cache.move_to_end(key)
+            return pixmap
+
+        pixmap = _create_transparent_pixmap(self.width(), self.height(), dpr)
+        pixmap_painter = QPainter(pixmap)
+        pixmap_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._paint_background(pixmap_painter, rect, lighter, darker, pen_alpha, highlight_alpha)
+        pixmap_painter.end()
 
-        background_gradient.setColorAt(0, lighter_color)
-        background_gradient.setColorAt(1, darker_color)
+        self._bg_pixmap_cache[key] = pixmap
+        if len(self._bg_pixmap_cache) > self.BG_PIXMAP_CACHE_SIZE:
+            self._bg_pixmap_cache.popitem(last=False)
+
+        return pixmap
+
+    def _paint_background(self, painter, rect, lighter, darker, pen_alpha, highlight_alpha):
+        """绘制渐变背景和高光"""
+        # 背景渐变
+        background_gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
+        background_gradient.setColorAt(0, self._BASE_COLOR.lighter(lighter))
+        background_gradient.setColorAt(1, self._BASE_COLOR.darker(darker))
 
         painter.setBrush(QBrush(background_gradient))
-        painter.setPen(QPen(QColor(255, 255, 255, int(30 + 20 * hover_factor)), 1))
+        painter.setPen(QPen(QColor(255, 255, 255, pen_alpha), 1))
         painter.drawRoundedRect(rect, 8, 8)
 
-        # 高光效果
-        if self._hover_intensity > 0:
+        # 高光效果（透明度取整为0时不可见，跳过）
+        if highlight_alpha > 0:
             highlight_rect = rect.adjusted(1, 1, -1, -rect.height()//2)
             highlight_gradient = QLinearGradient(0, highlight_rect.top(), 0, highlight_rect.bottom())
-            highlight_gradient.setColorAt(0, QColor(255, 255, 255, int(20 * hover_factor)))
-            highlight_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+            highlight_gradient.setColorAt(0, QColor(255, 255, 255, highlight_alpha))
+            highlight_gradient.setColorAt(1, self._HIGHLIGHT_END_COLOR)
 
             painter.setBrush(QBrush(highlight_gradient))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawRoundedRect(highlight_rect, 7, 7)
 
-        # 绘制文字
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Microsoft YaHei", 14, QFont.Weight.Bold))
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text())
-
     def enterEvent(self, event):
         """鼠标进入事件"""
         self.hover_animation.setStartValue(self._hover_intensity)
         self.hover_animation.setEndValue(100)
         self.hover_animation.start()
 
-        # 增强阴影效果
-        self.shadow_effect.setOffset(0, 4)
-        self.shadow_effect.setBlurRadius(12)
+        # 重绘以切换到悬停阴影
+        self.update()
         super().enterEvent(event)
 
     def leaveEvent(self, event):
@@ -801,9 +1255,8 @@ class EnhancedButton(QPushButton):
         self.hover_animation.setEndValue(0)
         self.hover_animation.start()
 
-        # 恢复阴影效果
-        self.shadow_effect.setOffset(0, 2)
-        self.shadow_effect.setBlurRadius(8)
+        # 重绘以恢复普通阴影
+        self.update()
         super().leaveEvent(event)
 
     # PyQt6属性定义
@@ -814,16 +1267,44 @@ class EnhancedButton(QPushButton):
     @hover_intensity.setter
     def hover_intensity(self, value):
         self._hover_intensity = value
-        self.update()
+        _schedule_repaint(self)
 
 
 class TexturedBackground(QWidget):
     """纹理背景组件 - 深色纹理效果"""
 
+    # 对角线纹理间距，纹理图块边长为两个间距（一个滚动周期）
+    STRIPE_SPACING = 20
+    # 噪点图块边长（物理像素），平铺绘制，与控件尺寸无关
+    NOISE_TILE_SIZE = 128
+    # 噪点采样在模块加载时生成一次，渲染时不再调用随机数
+    _NOISE_INDICES, _NOISE_VALUES = _generate_noise_samples(NOISE_TILE_SIZE)
+
+    # 预先构造的渐变色标和画笔
+    _BACKGROUND_STOPS = [
+        (0, QColor(15, 23, 42)),    # slate-900
+        (0.5, QColor(30, 41, 59)),  # slate-800
+        (1, QColor(51, 65, 85)),    # slate-700
+    ]
+    _STRIPE_PEN = QPen(QColor(255, 255, 255, 8), 1)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._texture_offset = 0
 
+        # 不透明渐变铺满整个控件，告知Qt跳过绘制前的背景擦除
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+
+        # 静态背景缓存（渐变和噪点，按设备像素比渲染的不透明RGB32图像），尺寸变化时重建
+        self._bg_cache = None
+
+        # 主背景渐变画刷（按填充区域比例定位，尺寸变化时无需重建）
+        main_gradient = QLinearGradient(0, 0, 0, 1)
+        main_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+        main_gradient.setStops(self._BACKGROUND_STOPS)
+        self._bg_brush = QBrush(main_gradient)
+
         # 纹理动画（可选）
         self.texture_animation = QPropertyAnimation(self, b"texture_offset")
         self.texture_animation.setDuration(20000)  # 20秒循环
@@ -833,65 +1314,114 @@ class TexturedBackground(QWidget):
 
     def paintEvent(self, event):
         """绘制纹理背景"""
+        rect = self.rect()
+        dpr = self.devicePixelRatioF()
+
+        if self._bg_cache is None or self._bg_cache.devicePixelRatio() != dpr:
+            self._bg_cache = self._render_static_background(rect, dpr)
+
+        # 只重绘脏区域（子控件动画时通常只需刷新其下方的一小块背景）
+        dirty_rect = event.rect() & rect
+        if dirty_rect.isEmpty():
+            return
+
+        # 只有贴图操作，无需抗锯齿
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        rect = self.rect()
+        # 绘制缓存的渐变和噪点（源区域按物理像素换算）
+        painter.drawImage(QRectF(dirty_rect),
+                          self._bg_cache,
+                          QRectF(dirty_rect.x() * dpr, dirty_rect.y() * dpr,
+                                 dirty_rect.width() * dpr, dirty_rect.height() * dpr))
 
-        # 主背景渐变
-        main_gradient = QLinearGradient(0, 0, 0, rect.height())
-        main_gradient.setColorAt(0, QColor(15, 23, 42))   # slate-900
-        main_gradient.setColorAt(0.5, QColor(30, 41, 59)) # slate-800
-        main_gradient.setColorAt(1, QColor(51, 65, 85))   # slate-700
+        # 添加纹理图案（随动画偏移，每帧绘制）
+        self._draw_texture_pattern(painter, dirty_rect)
 
-        painter.fillRect(rect, QBrush(main_gradient))
+    def resizeEvent(self, event):
+        """尺寸变化时重建静态背景"""
+        self._bg_cache = None
+        super().resizeEvent(event)
 
-        # 添加纹理图案
-        self._draw_texture_pattern(painter, rect)
+    def showEvent(self, event):
+        """重新显示时恢复被暂停的纹理动画"""
+        if self.texture_animation.state() == QPropertyAnimation.State.Paused:
+            self.texture_animation.resume()
+        super().showEvent(event)
 
-        # 添加微妙的噪点效果
-        self._draw_noise_pattern(painter, rect)
+    def hideEvent(self, event):
+        """隐藏（如最小化到托盘）时暂停纹理动画，避免定时器持续唤醒GUI线程"""
+        if self.texture_animation.state() == QPropertyAnimation.State.Running:
+            self.texture_animation.pause()
+        super().hideEvent(event)
 
-    def _draw_texture_pattern(self, painter, rect):
-        """绘制纹理图案"""
-        painter.save()
+    def _render_static_background(self, rect, dpr):
+        """渲染静态背景（主渐变和噪点）
 
-        # 设置半透明画笔
-        painter.setPen(QPen(QColor(255, 255, 255, 8), 1))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
+        背景完全不透明，使用 Format_RGB32 图像，贴图时走光栅引擎的直接拷贝路径。
+        """
+        image = QImage(int(rect.width() * dpr), int(rect.height() * dpr), QImage.Format.Format_RGB32)
+        image.setDevicePixelRatio(dpr)
+
+        image_painter = QPainter(image)
 
-        # 绘制对角线纹理
-        spacing = 20
-        offset = int(self._texture_offset) % (spacing * 2)
+        # 主背景渐变
+        image_painter.fillRect(rect, self._bg_brush)
 
-        for i in range(-spacing, rect.width() + rect.height(), spacing):
-            x1 = i - offset
-            y1 = 0
-            x2 = i + rect.height() - offset
-            y2 = rect.height()
-            painter.drawLine(x1, y1, x2, y2)
+        # 添加微妙的噪点效果（预乘Alpha缓冲区）
+        self._draw_noise_pattern(image_painter, rect, dpr)
+        image_painter.end()
 
-        painter.restore()
+        return image
 
-    def _draw_noise_pattern(self, painter, rect):
-        """绘制噪点图案"""
-        painter.save()
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _render_stripe_tile(cls, dpr):
+        """渲染可无缝平铺的对角线纹理图块（按设备像素比，平铺绘制代替逐条画线）"""
+        tile_size = cls.STRIPE_SPACING * 2
+        tile = _create_transparent_pixmap(tile_size, tile_size, dpr)
 
-        # 创建随机噪点
-        import random
-        random.seed(42)  # 固定种子确保一致性
+        # 1px、alpha为8的45°细线关闭抗锯齿后外观几乎无差别，且像素对齐可无缝平铺
+        tile_painter = QPainter(tile)
 
-        painter.setPen(Qt.PenStyle.NoPen)
+        # 设置半透明画笔（只画线条，画刷不参与绘制）
+        tile_painter.setPen(cls._STRIPE_PEN)
 
-        for _ in range(rect.width() * rect.height() // 2000):  # 控制噪点密度
-            x = random.randint(0, rect.width())
-            y = random.randint(0, rect.height())
-            alpha = random.randint(5, 15)
+        # 一次绘制所有穿过图块的对角线（含相邻图块延伸进来的部分）
+        tile_painter.drawLines([QLineF(i, 0, i + tile_size, tile_size)
+                                for i in range(-tile_size, tile_size + 1, cls.STRIPE_SPACING)])
 
-            painter.setBrush(QBrush(QColor(255, 255, 255, alpha)))
-            painter.drawEllipse(x, y, 1, 1)
+        tile_painter.end()
+        return tile
 
-        painter.restore()
+    def _draw_texture_pattern(self, painter, rect):
+        """绘制纹理图案（rect可以是控件内的任意子区域）"""
+        # 平铺对角线纹理，图块起点按动画偏移滚动，并与控件坐标对齐
+        period = self.STRIPE_SPACING * 2
+        offset = int(self._texture_offset)
+        painter.drawTiledPixmap(rect, self._render_stripe_tile(self.devicePixelRatioF()),
+                                QPoint((rect.x() + offset) % period, rect.y() % period))
+
+    def _draw_noise_pattern(self, painter, rect, dpr):
+        """绘制噪点图案 - 平铺缓存的噪点图块"""
+        painter.drawTiledPixmap(rect, self._render_noise_tile(dpr))
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _render_noise_tile(cls, dpr):
+        """渲染可平铺的噪点图块 - 按物理像素直接写入像素缓冲区"""
+        size = cls.NOISE_TILE_SIZE
+
+        # 按预先生成的采样写入预乘Alpha像素（32位整体写入）
+        buffer = bytearray(size * size * 4)
+        pixels = memoryview(buffer).cast('I')
+
+        for index, value in zip(cls._NOISE_INDICES, cls._NOISE_VALUES):
+            pixels[index] = value
+
+        noise_image = QImage(buffer, size, size, size * 4, QImage.Format.Format_ARGB32_Premultiplied)
+        tile = QPixmap.fromImage(noise_image)
+        tile.setDevicePixelRatio(dpr)
+        return tile
 
     def start_texture_animation(self):
         """启动纹理动画"""
@@ -908,5 +1438,9 @@ class TexturedBackground(QWidget):
 
     @texture_offset.setter
     def texture_offset(self, value):
+        # 纹理按整像素偏移绘制，偏移未跨越整像素时画面不变，无需重绘
+        period = self.STRIPE_SPACING * 2
+        changed = int(value) % period != int(self._texture_offset) % period
         self._texture_offset = value
-        self.update()
+        if changed:
+            self.update()
@@ -5,54 +5,103 @@
 """
 
 import sys
-import os
 import logging
 import subprocess
-from datetime import datetime
+import importlib.util
+from pathlib import Path
+from functools import lru_cache
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                             QHBoxLayout, QGridLayout, QLabel, QPushButton,
-                             QFrame, QDialog, QLineEdit, QComboBox, QMessageBox,
-                             QCheckBox, QSpinBox, QTextEdit, QRadioButton, QButtonGroup,
-                             QSplitter, QGroupBox, QListWidget, QScrollArea, QStatusBar)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QRect, QEasingCurve
-from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush, QLinearGradient, QIcon
+                             QHBoxLayout, QLabel, QPushButton, QDialog, QLineEdit,
+                             QComboBox, QMessageBox, QCheckBox, QSpinBox, QRadioButton,
+                             QButtonGroup, QListWidget)
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer
 
 # 添加项目根目录到Python路径
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, project_root)
-
-# 导入新的模块化组件
-from app.modules import (
-    ConfigManager, AccountingManager, WechatServiceManager, 
-    WxautoManager, MessageListener, MessageDelivery, 
-    LogManager, ServiceMonitor
-)
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 # 导入增强版UI组件（美化版本）
 from app.qt_ui.enhanced_ui_components import (EnhancedCircularButton, EnhancedStatusIndicator,
                                               EnhancedStatCard, EnhancedButton, TexturedBackground)
 
-# 导入日志窗口
-from app.qt_ui.enhanced_log_window import EnhancedLogWindow
+logger = logging.getLogger(__name__)
+
+# 按需导入的名称（模块化组件、统一统计系统；日志窗口类由 _log_window_class 导入）。
+# 模块内部在使用处局部导入；外部以属性方式访问时由 __getattr__ 首次导入并缓存。
+_LAZY_IMPORTS = {
+    'ConfigManager': 'app.modules',
+    'AccountingManager': 'app.modules',
+    'WechatServiceManager': 'app.modules',
+    'WxautoManager': 'app.modules',
+    'MessageListener': 'app.modules',
+    'MessageDelivery': 'app.modules',
+    'LogManager': 'app.modules',
+    'ServiceMonitor': 'app.modules',
+    'get_unified_statistics': 'app.utils.unified_statistics',
+}
 
-# 导入统一统计系统
-from app.utils.unified_statistics import get_unified_statistics
 
-logger = logging.getLogger(__name__)
+def __getattr__(name):
+    """模块级延迟导入（PEP 562）"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+@lru_cache(maxsize=1)
+def _log_window_class():
+    """首次打开日志窗口时才导入日志窗口模块"""
+    from app.qt_ui.enhanced_log_window import EnhancedLogWindow
+    return EnhancedLogWindow
+
+
+# 默认账本在下拉框中的显示后缀，以及保存账本原始名称的数据角色
+_DEFAULT_BOOK_SUFFIX = " (默认)"
+_BOOK_NAME_ROLE = Qt.ItemDataRole.UserRole + 1
 
 
-class LoginThread(QThread):
-    """登录线程 - 使用新的记账管理器"""
+def _set_label_state(label, state):
+    """切换标签的状态属性，由对话框样式表中的 QLabel[state=...] 规则着色"""
+    label.setProperty("state", state)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
+
+
+# 微信自动化库名称（配置对话框中显示安装状态的库）
+_LIBRARY_NAMES = ("wxauto", "wxautox")
+
+
+@lru_cache(maxsize=len(_LIBRARY_NAMES))
+def _probe_library(name: str) -> bool:
+    """检查库是否已安装（只查找模块规格，不执行模块代码，结果在进程内缓存）"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LoginWorker(QObject):
+    """登录结果信号载体（在UI线程创建，后台任务发出的信号自动排队回到UI线程）"""
     login_success = pyqtSignal(object)  # 登录成功信号
     login_failed = pyqtSignal(str)      # 登录失败信号
-    
-    def __init__(self, accounting_manager, server_url, username, password):
+
+
+class LoginRunnable(QRunnable):
+    """登录任务 - 使用新的记账管理器，在全局线程池中执行以复用线程"""
+
+    def __init__(self, worker, accounting_manager, server_url, username, password):
         super().__init__()
+        self.worker = worker
         self.accounting_manager = accounting_manager
         self.server_url = server_url
         self.username = username
         self.password = password
-    
+
     def run(self):
         """执行登录操作"""
         try:
@@ -60,7 +109,7 @@ class LoginThread(QThread):
             success, message = self.accounting_manager.login(
                 self.server_url, self.username, self.password
             )
-            
+
             if success:
                 # 登录成功，构建登录数据
                 login_data = {
@@ -70,16 +119,178 @@ class LoginThread(QThread):
                     'server_url': self.server_url,
                     'books': []  # 新架构中暂时不需要账本列表
                 }
-                self.login_success.emit(login_data)
+                self.worker.login_success.emit(login_data)
             else:
-                self.login_failed.emit(message)
-                
+                self.worker.login_failed.emit(message)
+
         except Exception as e:
-            self.login_failed.emit(f"登录过程中发生错误: {str(e)}")
+            self.worker.login_failed.emit(f"登录过程中发生错误: {str(e)}")
+
+
+class LibraryProbeWorker(QObject):
+    """库安装状态检查结果信号载体"""
+    probe_finished = pyqtSignal(dict)  # {库名: 是否已安装}
+
+
+class LibraryProbeRunnable(QRunnable):
+    """库安装状态检查任务 - 首次查找模块规格可能访问文件系统，放到线程池执行"""
+
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        """执行检查"""
+        try:
+            self.worker.probe_finished.emit({name: _probe_library(name) for name in _LIBRARY_NAMES})
+        except Exception as e:
+            logger.error(f"检查库状态失败: {e}")
+
+
+class ActivationWorker(QObject):
+    """wxautox激活结果信号载体"""
+    # 结果类型（success/failed/timeout/error）与消息
+    activation_finished = pyqtSignal(str, str)
+
+
+class ActivationRunnable(QRunnable):
+    """wxautox激活任务 - 在全局线程池中执行，避免阻塞UI线程"""
+
+    def __init__(self, worker, activation_code):
+        super().__init__()
+        self.worker = worker
+        self.activation_code = activation_code
+
+    def run(self):
+        """执行激活操作"""
+        try:
+            # 使用subprocess执行激活命令
+            result = subprocess.run(
+                [sys.executable, "-m", "wxautox", "-a", self.activation_code],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            if result.returncode == 0:
+                self.worker.activation_finished.emit('success', "")
+            else:
+                error_msg = result.stderr or result.stdout or "激活失败"
+                self.worker.activation_finished.emit('failed', error_msg)
+
+        except subprocess.TimeoutExpired:
+            self.worker.activation_finished.emit('timeout', "")
+        except Exception as e:
+            self.worker.activation_finished.emit('error', str(e))
 
 
 class ConfigDialog(QDialog):
     """配置对话框 - 保持旧版样式"""
+
+    # 对话框样式表（类级常量，每次打开对话框无需重新构造）
+    _DIALOG_QSS = """
+        QDialog {
+            background-color: #1e293b;
+            color: white;
+        }
+        QLabel {
+            color: white;
+            font-size: 12px;
+            margin: 4px 0;
+        }
+        QLineEdit, QComboBox, QSpinBox {
+            background-color: #334155;
+            border: 1px solid #475569;
+            border-radius: 4px;
+            padding: 8px;
+            color: white;
+            font-size: 12px;
+            min-height: 20px;
+        }
+        QCheckBox {
+            color: white;
+            font-size: 12px;
+            spacing: 8px;
+        }
+        QCheckBox::indicator {
+            width: 16px;
+            height: 16px;
+            border: 1px solid #475569;
+            border-radius: 3px;
+            background-color: #334155;
+        }
+        QCheckBox::indicator:checked {
+            background-color: #3b82f6;
+            border-color: #3b82f6;
+        }
+        QRadioButton {
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            spacing: 8px;
+            padding: 4px;
+        }
+        QRadioButton::indicator {
+            width: 16px;
+            height: 16px;
+            border: 2px solid #64748b;
+            border-radius: 8px;
+            background-color: transparent;
+        }
+        QRadioButton::indicator:checked {
+            background-color: #3b82f6;
+            border-color: #3b82f6;
+        }
+        QRadioButton::indicator:hover {
+            border-color: #64748b;
+        }
+        QPushButton {
+            background-color: #3b82f6;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 16px;
+            color: white;
+            font-weight: bold;
+            min-height: 20px;
+        }
+        QPushButton:hover {
+            background-color: #2563eb;
+        }
+        QPushButton:disabled {
+            background-color: #6b7280;
+            color: #9ca3af;
+        }
+        QTextEdit {
+            background-color: #334155;
+            border: 1px solid #475569;
+            border-radius: 4px;
+            padding: 8px;
+            color: white;
+            font-size: 12px;
+        }
+        QLabel[state="ok"] {
+            color: #22c55e;
+            font-weight: bold;
+        }
+        QLabel[state="success"] {
+            color: #10b981;
+            font-weight: bold;
+        }
+        QLabel[state="err"] {
+            color: #ef4444;
+            font-weight: bold;
+        }
+        QLabel[state="pending"] {
+            color: #fbbf24;
+        }
+        QLabel[state="mute"] {
+            color: #64748b;
+        }
+        QLabel[hint="true"] {
+            font-size: 11px;
+            font-weight: normal;
+        }
+    """
     
     def __init__(self, config_type, config_manager=None, accounting_manager=None, 
                  wechat_service_manager=None, parent=None):
@@ -88,104 +299,68 @@ class ConfigDialog(QDialog):
         self.config_manager = config_manager
         self.accounting_manager = accounting_manager
         self.wechat_service_manager = wechat_service_manager
+
+        # 已构建的延迟区域（首次显示时才创建其中的控件）
+        self._populated = set()
+
+        # 监听会话列表的Python侧镜像（与sessions_list保持同步，避免逐项读取列表控件）
+        self._sessions_list_data = []
+        self._sessions_set = set()
+
+        # 账本列表加载中标记（加载期间不把选择写回配置文件）
+        self._loading_books = False
+
+        # 是否已安排延迟的adjustSize（合并连续的库切换）
+        self._adjust_pending = False
+
+        # 账本ID到下拉框索引的映射（刷新账本列表时重建）
+        self._book_index_by_id = {}
+
+        # 复用的提示框（首次提示时创建）
+        self._msgbox = None
+
+        # 账本选择写盘去抖：连续的选择变更只在最后一次之后写入一次配置
+        self._pending_book = None
+        self._book_write_timer = QTimer(self)
+        self._book_write_timer.setSingleShot(True)
+        self._book_write_timer.setInterval(200)
+        self._book_write_timer.timeout.connect(self._flush_book_selection)
         
         self.setWindowTitle(f"{config_type}配置")
         self.setMinimumSize(450, 400)
         # 不设置固定大小，让对话框根据内容自动调整
         
         # 保持旧版样式
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e293b;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 12px;
-                margin: 4px 0;
-            }
-            QLineEdit, QComboBox, QSpinBox {
-                background-color: #334155;
-                border: 1px solid #475569;
-                border-radius: 4px;
-                padding: 8px;
-                color: white;
-                font-size: 12px;
-                min-height: 20px;
-            }
-            QCheckBox {
-                color: white;
-                font-size: 12px;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 1px solid #475569;
-                border-radius: 3px;
-                background-color: #334155;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3b82f6;
-                border-color: #3b82f6;
-            }
-            QRadioButton {
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                spacing: 8px;
-                padding: 4px;
-            }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #475569;
-                border-radius: 8px;
-                background-color: #334155;
-            }
-            QRadioButton::indicator:checked {
-                background-color: #3b82f6;
-                border-color: #3b82f6;
-            }
-            QPushButton {
-                background-color: #3b82f6;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-            QPushButton:disabled {
-                background-color: #6b7280;
-                color: #9ca3af;
-            }
-            QTextEdit {
-                background-color: #334155;
-                border: 1px solid #475569;
-                border-radius: 4px;
-                padding: 8px;
-                color: white;
-                font-size: 12px;
-            }
-        """)
+        self.setStyleSheet(ConfigDialog._DIALOG_QSS)
         
         self.setup_ui()
 
-        # 设置窗口自适应内容
-        self.adjustSize()
-
         # 确保窗口不会太小
         if self.height() < 500:
             self.resize(self.width(), 500)
     
+    def _show_message(self, icon, title, text):
+        """显示提示框（复用同一个QMessageBox，避免每次提示都新建）"""
+        if self._msgbox is None:
+            self._msgbox = QMessageBox(self)
+        elif self._msgbox.isVisible():
+            # 已有提示框正在显示（嵌套提示），临时创建一个
+            box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+            box.exec()
+            box.deleteLater()
+            return
+
+        self._msgbox.setIcon(icon)
+        self._msgbox.setWindowTitle(title)
+        self._msgbox.setText(text)
+        self._msgbox.exec()
+
     def setup_ui(self):
         """设置UI"""
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
+        # 批量添加控件期间暂停布局计算，构建完成后统一计算一次
+        layout.setEnabled(False)
         
         if self.config_type == "只为记账服务":
             self.setup_accounting_ui(layout)
@@ -209,6 +384,7 @@ class ConfigDialog(QDialog):
 
         # 加载配置并调整大小
         self.load_current_config()
+        layout.setEnabled(True)
         # 调整对话框大小以适应内容
         self.adjustSize()
     
@@ -240,7 +416,7 @@ class ConfigDialog(QDialog):
 
         # 状态显示
         self.status_label = QLabel("状态: 未连接")
-        self.status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
+        _set_label_state(self.status_label, "err")
         layout.addWidget(self.status_label)
 
         # 账本选择区域
@@ -260,7 +436,8 @@ class ConfigDialog(QDialog):
 
         # 账本状态显示
         self.account_status_label = QLabel("账本: 未选择")
-        self.account_status_label.setStyleSheet("color: #64748b; font-size: 11px;")
+        self.account_status_label.setProperty("hint", True)
+        _set_label_state(self.account_status_label, "mute")
         layout.addWidget(self.account_status_label)
     
     def setup_wechat_ui(self, layout):
@@ -275,34 +452,6 @@ class ConfigDialog(QDialog):
         self.wxauto_radio = QRadioButton("wxauto (开源版)")
         self.wxautox_radio = QRadioButton("wxautox (Plus版)")
 
-        # 设置单选框样式
-        radio_style = """
-            QRadioButton {
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                spacing: 8px;
-                padding: 4px;
-            }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 8px;
-                border: 2px solid #64748b;
-                background-color: transparent;
-            }
-            QRadioButton::indicator:checked {
-                background-color: #3b82f6;
-                border-color: #3b82f6;
-            }
-            QRadioButton::indicator:hover {
-                border-color: #64748b;
-            }
-        """
-
-        self.wxauto_radio.setStyleSheet(radio_style)
-        self.wxautox_radio.setStyleSheet(radio_style)
-
         self.library_group.addButton(self.wxauto_radio, 0)
         self.library_group.addButton(self.wxautox_radio, 1)
 
@@ -336,27 +485,9 @@ class ConfigDialog(QDialog):
         # 检查库状态
         self.check_library_status()
 
-        # 2. wxautox激活功能区域
+        # 2. wxautox激活功能区域（占位容器，选择wxautox时才创建内部控件）
         self.activation_widget = QWidget()
-        activation_layout = QVBoxLayout(self.activation_widget)
-
-        activation_layout.addWidget(QLabel("wxautox激活码:"))
-
-        activation_input_layout = QHBoxLayout()
-        self.activation_code_edit = QLineEdit()
-        self.activation_code_edit.setPlaceholderText("请输入wxautox激活码")
-        self.activation_btn = QPushButton("激活")
-        self.activation_btn.clicked.connect(self.activate_wxautox)
-
-        activation_input_layout.addWidget(self.activation_code_edit)
-        activation_input_layout.addWidget(self.activation_btn)
-
-        activation_layout.addLayout(activation_input_layout)
-
-        # 激活状态显示
-        self.activation_status_label = QLabel("")
-        activation_layout.addWidget(self.activation_status_label)
-
+        QVBoxLayout(self.activation_widget)
         layout.addWidget(self.activation_widget)
 
         # 默认隐藏激活区域
@@ -434,103 +565,140 @@ class ConfigDialog(QDialog):
         self.template_edit.setPlaceholderText("自动回复的消息模板")
         layout.addWidget(self.template_edit)
 
+    def _populate_activation_widget(self):
+        """创建wxautox激活区域的控件（仅在首次显示时创建一次）"""
+        if 'activation' in self._populated:
+            return
+        self._populated.add('activation')
+
+        activation_layout = self.activation_widget.layout()
+
+        activation_layout.addWidget(QLabel("wxautox激活码:"))
+
+        activation_input_layout = QHBoxLayout()
+        self.activation_code_edit = QLineEdit()
+        self.activation_code_edit.setPlaceholderText("请输入wxautox激活码")
+        self.activation_btn = QPushButton("激活")
+        self.activation_btn.clicked.connect(self.activate_wxautox)
+
+        activation_input_layout.addWidget(self.activation_code_edit)
+        activation_input_layout.addWidget(self.activation_btn)
+
+        activation_layout.addLayout(activation_input_layout)
+
+        # 激活状态显示
+        self.activation_status_label = QLabel("")
+        activation_layout.addWidget(self.activation_status_label)
+
     def check_library_status(self):
         """检查wxauto和wxautox库的安装状态"""
         try:
-            # 检查wxauto
-            try:
-                import wxauto
-                self.wxauto_status_label.setText("✓ 已安装")
-                self.wxauto_status_label.setStyleSheet("color: #10b981; font-weight: bold;")
-            except ImportError:
-                self.wxauto_status_label.setText("✗ 未安装")
-                self.wxauto_status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-
-            # 检查wxautox
-            try:
-                import wxautox
-                self.wxautox_status_label.setText("✓ 已安装")
-                self.wxautox_status_label.setStyleSheet("color: #10b981; font-weight: bold;")
-            except ImportError:
-                self.wxautox_status_label.setText("✗ 未安装")
-                self.wxautox_status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
+            # 检查wxauto和wxautox（不导入模块，避免初始化COM/UIAutomation）
+            if _probe_library.cache_info().currsize == len(_LIBRARY_NAMES):
+                # 结果均已缓存，直接显示
+                self.on_library_status_ready({name: _probe_library(name) for name in _LIBRARY_NAMES})
+                return
+
+            # 首次检查放到线程池，标签保持"检查中..."直到结果返回
+            self.library_probe_worker = LibraryProbeWorker(self)
+            self.library_probe_worker.probe_finished.connect(self.on_library_status_ready)
+            QThreadPool.globalInstance().start(LibraryProbeRunnable(self.library_probe_worker))
 
         except Exception as e:
             logger.error(f"检查库状态失败: {e}")
 
+    def on_library_status_ready(self, status):
+        """显示库安装状态"""
+        for name, label in (("wxauto", self.wxauto_status_label),
+                            ("wxautox", self.wxautox_status_label)):
+            if status.get(name):
+                label.setText("✓ 已安装")
+                _set_label_state(label, "success")
+            else:
+                label.setText("✗ 未安装")
+                _set_label_state(label, "err")
+
     def on_library_changed(self):
         """库选择变化时的处理"""
         if hasattr(self, 'wxautox_radio') and self.wxautox_radio.isChecked():
             # 选择wxautox时显示激活区域
+            self._populate_activation_widget()
             self.activation_widget.setVisible(True)
         else:
             # 选择wxauto时隐藏激活区域
             self.activation_widget.setVisible(False)
 
-        # 调整对话框大小以适应内容
+        # 延迟到事件循环中调整大小，连续切换只计算一次布局
+        if not self._adjust_pending:
+            self._adjust_pending = True
+            QTimer.singleShot(0, self._deferred_adjust_size)
+
+    def _deferred_adjust_size(self):
+        """执行合并后的对话框尺寸调整"""
+        self._adjust_pending = False
         self.adjustSize()
 
     def activate_wxautox(self):
         """激活wxautox"""
         activation_code = self.activation_code_edit.text().strip()
         if not activation_code:
-            QMessageBox.warning(self, "警告", "请输入激活码")
+            self._show_message(QMessageBox.Icon.Warning, "警告", "请输入激活码")
             return
 
         try:
-            import subprocess
-            import sys
-
             # 执行激活命令
             self.activation_btn.setEnabled(False)
             self.activation_btn.setText("激活中...")
             self.activation_status_label.setText("正在激活...")
-            self.activation_status_label.setStyleSheet("color: #fbbf24;")
+            _set_label_state(self.activation_status_label, "pending")
 
-            # 使用subprocess执行激活命令
-            result = subprocess.run(
-                [sys.executable, "-m", "wxautox", "-a", activation_code],
-                capture_output=True,
-                text=True,
-                timeout=30
+            # 提交激活任务到全局线程池，结果通过信号回到UI线程
+            self.activation_worker = ActivationWorker(self)
+            self.activation_worker.activation_finished.connect(self.on_activation_finished)
+            QThreadPool.globalInstance().start(
+                ActivationRunnable(self.activation_worker, activation_code)
             )
 
-            if result.returncode == 0:
-                self.activation_status_label.setText("✓ 激活成功")
-                self.activation_status_label.setStyleSheet("color: #10b981; font-weight: bold;")
-                QMessageBox.information(self, "成功", "wxautox激活成功！")
-            else:
-                error_msg = result.stderr or result.stdout or "激活失败"
-                self.activation_status_label.setText(f"✗ 激活失败: {error_msg}")
-                self.activation_status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-                QMessageBox.warning(self, "失败", f"激活失败: {error_msg}")
-
-        except subprocess.TimeoutExpired:
-            self.activation_status_label.setText("✗ 激活超时")
-            self.activation_status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-            QMessageBox.warning(self, "超时", "激活请求超时，请检查网络连接")
         except Exception as e:
-            self.activation_status_label.setText(f"✗ 激活错误: {str(e)}")
-            self.activation_status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
-            QMessageBox.critical(self, "错误", f"激活过程中发生错误: {str(e)}")
-        finally:
-            self.activation_btn.setEnabled(True)
-            self.activation_btn.setText("激活")
+            self.on_activation_finished('error', str(e))
+
+    def on_activation_finished(self, result, message):
+        """激活完成"""
+        if result == 'success':
+            self.activation_status_label.setText("✓ 激活成功")
+            _set_label_state(self.activation_status_label, "success")
+            self._show_message(QMessageBox.Icon.Information, "成功", "wxautox激活成功！")
+        elif result == 'failed':
+            self.activation_status_label.setText(f"✗ 激活失败: {message}")
+            _set_label_state(self.activation_status_label, "err")
+            self._show_message(QMessageBox.Icon.Warning, "失败", f"激活失败: {message}")
+        elif result == 'timeout':
+            self.activation_status_label.setText("✗ 激活超时")
+            _set_label_state(self.activation_status_label, "err")
+            self._show_message(QMessageBox.Icon.Warning, "超时", "激活请求超时，请检查网络连接")
+        else:
+            self.activation_status_label.setText(f"✗ 激活错误: {message}")
+            _set_label_state(self.activation_status_label, "err")
+            self._show_message(QMessageBox.Icon.Critical, "错误", f"激活过程中发生错误: {message}")
+
+        self.activation_btn.setEnabled(True)
+        self.activation_btn.setText("激活")
 
     def add_session(self):
         """添加监控会话"""
         session_name = self.session_input.text().strip()
         if not session_name:
-            QMessageBox.warning(self, "警告", "请输入会话名称")
+            self._show_message(QMessageBox.Icon.Warning, "警告", "请输入会话名称")
             return
 
         # 检查是否已存在
-        for i in range(self.sessions_list.count()):
-            if self.sessions_list.item(i).text() == session_name:
-                QMessageBox.warning(self, "警告", "该会话已存在")
-                return
+        if session_name in self._sessions_set:
+            self._show_message(QMessageBox.Icon.Warning, "警告", "该会话已存在")
+            return
 
         # 添加到列表
+        self._sessions_list_data.append(session_name)
+        self._sessions_set.add(session_name)
         self.sessions_list.addItem(session_name)
         self.session_input.clear()
         logger.info(f"添加监控会话: {session_name}")
@@ -539,7 +707,7 @@ class ConfigDialog(QDialog):
         """删除选中的会话"""
         current_item = self.sessions_list.currentItem()
         if not current_item:
-            QMessageBox.warning(self, "警告", "请选择要删除的会话")
+            self._show_message(QMessageBox.Icon.Warning, "警告", "请选择要删除的会话")
             return
 
         session_name = current_item.text()
@@ -552,10 +720,14 @@ class ConfigDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             row = self.sessions_list.row(current_item)
             self.sessions_list.takeItem(row)
+            del self._sessions_list_data[row]
+            self._sessions_set.discard(session_name)
             logger.info(f"删除监控会话: {session_name}")
 
     def load_current_config(self):
         """加载当前配置"""
+        # 加载未完成时禁止保存，避免用控件默认值覆盖现有配置
+        self._config_loaded = False
         if not self.config_manager:
             return
 
@@ -566,10 +738,17 @@ class ConfigDialog(QDialog):
                 self.username_edit.setText(config.username)
                 self.password_edit.setText(config.password)
 
+                # 复用的对话框先恢复初始状态，避免显示上次打开时的连接结果
+                self.status_label.setText("状态: 未连接")
+                _set_label_state(self.status_label, "err")
+                self.account_status_label.setText("账本: 未选择")
+                _set_label_state(self.account_status_label, "mute")
+                self.refresh_books_btn.setEnabled(False)
+
                 # 检查连接状态
                 if self.accounting_manager and self.accounting_manager.get_token():
                     self.status_label.setText("状态: 已连接")
-                    self.status_label.setStyleSheet("color: #22c55e; font-weight: bold;")
+                    _set_label_state(self.status_label, "ok")
 
                     # 如果已连接，启用账本刷新按钮并尝试加载账本
                     if hasattr(self, 'refresh_books_btn'):
@@ -577,13 +756,18 @@ class ConfigDialog(QDialog):
                         # 如果有保存的账本信息，显示在状态中
                         if hasattr(config, 'account_book_name') and config.account_book_name:
                             self.account_status_label.setText(f"账本: {config.account_book_name}")
-                            self.account_status_label.setStyleSheet("color: #22c55e; font-size: 11px;")
+                            _set_label_state(self.account_status_label, "ok")
 
             elif self.config_type == "微信监控服务":
                 # 加载微信监控配置
                 wechat_config = self.config_manager.get_wechat_monitor_config()
                 wxauto_config = self.config_manager.get_wxauto_config()
 
+                # 清除上次打开时的激活结果（激活区域仅在选择过wxautox后才创建）
+                if 'activation' in self._populated:
+                    self.activation_status_label.setText("")
+                    _set_label_state(self.activation_status_label, None)
+
                 # 设置库选择
                 library_type = wxauto_config.library_type
                 if library_type == "wxauto":
@@ -595,9 +779,14 @@ class ConfigDialog(QDialog):
                 self.on_library_changed()
 
                 # 加载监控会话列表
-                self.sessions_list.clear()
-                for chat in wechat_config.monitored_chats:
-                    self.sessions_list.addItem(chat)
+                self._sessions_list_data = list(wechat_config.monitored_chats)
+                self._sessions_set = set(self._sessions_list_data)
+                self.sessions_list.setUpdatesEnabled(False)
+                try:
+                    self.sessions_list.clear()
+                    self.sessions_list.addItems(self._sessions_list_data)
+                finally:
+                    self.sessions_list.setUpdatesEnabled(True)
 
                 # 设置监听间隔（从服务监控配置获取）
                 service_config = self.config_manager.get_service_monitor_config()
@@ -608,8 +797,10 @@ class ConfigDialog(QDialog):
                 self.auto_reply_check.setChecked(wechat_config.auto_reply)
                 self.template_edit.setText(wechat_config.reply_template)
 
+            self._config_loaded = True
+
         except Exception as e:
-            logger.error(f"加载配置失败: {e}")
+            logger.error(f"加载配置失败: {e}", exc_info=True)
     
     def test_accounting_connection(self):
         """测试记账连接"""
@@ -619,30 +810,30 @@ class ConfigDialog(QDialog):
             password = self.password_edit.text().strip()
             
             if not all([server_url, username, password]):
-                QMessageBox.warning(self, "警告", "请填写完整的连接信息")
+                self._show_message(QMessageBox.Icon.Warning, "警告", "请填写完整的连接信息")
                 return
             
             self.login_btn.setEnabled(False)
             self.login_btn.setText("连接中...")
             
-            # 创建登录线程
-            self.login_thread = LoginThread(
-                self.accounting_manager, server_url, username, password
-            )
-            self.login_thread.login_success.connect(self.on_login_success)
-            self.login_thread.login_failed.connect(self.on_login_failed)
-            self.login_thread.start()
+            # 提交登录任务到全局线程池（复用线程，不再每次点击创建新线程）
+            self.login_worker = LoginWorker(self)
+            self.login_worker.login_success.connect(self.on_login_success)
+            self.login_worker.login_failed.connect(self.on_login_failed)
+            QThreadPool.globalInstance().start(LoginRunnable(
+                self.login_worker, self.accounting_manager, server_url, username, password
+            ))
             
         except Exception as e:
             logger.error(f"测试连接失败: {e}")
-            QMessageBox.warning(self, "错误", f"测试连接失败: {str(e)}")
+            self._show_message(QMessageBox.Icon.Warning, "错误", f"测试连接失败: {str(e)}")
             self.login_btn.setEnabled(True)
             self.login_btn.setText("测试连接")
     
     def on_login_success(self, login_data):
         """登录成功"""
         self.status_label.setText("状态: 连接成功")
-        self.status_label.setStyleSheet("color: #22c55e; font-weight: bold;")
+        _set_label_state(self.status_label, "ok")
         self.login_btn.setEnabled(True)
         self.login_btn.setText("测试连接")
 
@@ -652,12 +843,12 @@ class ConfigDialog(QDialog):
             # 自动刷新账本列表
             self.refresh_account_books()
 
-        QMessageBox.information(self, "成功", "连接测试成功！")
+        self._show_message(QMessageBox.Icon.Information, "成功", "连接测试成功！")
     
     def on_login_failed(self, error_message):
         """登录失败"""
         self.status_label.setText("状态: 连接失败")
-        self.status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
+        _set_label_state(self.status_label, "err")
         self.login_btn.setEnabled(True)
         self.login_btn.setText("测试连接")
 
@@ -665,18 +856,18 @@ class ConfigDialog(QDialog):
         if hasattr(self, 'refresh_books_btn'):
             self.refresh_books_btn.setEnabled(False)
 
-        QMessageBox.warning(self, "失败", f"连接测试失败: {error_message}")
+        self._show_message(QMessageBox.Icon.Warning, "失败", f"连接测试失败: {error_message}")
 
     def refresh_account_books(self):
         """刷新账本列表"""
         try:
             if not self.accounting_manager:
-                QMessageBox.warning(self, "错误", "记账管理器未初始化")
+                self._show_message(QMessageBox.Icon.Warning, "错误", "记账管理器未初始化")
                 return
 
             # 检查是否已登录
             if not self.accounting_manager.get_token():
-                QMessageBox.warning(self, "错误", "请先测试连接并登录")
+                self._show_message(QMessageBox.Icon.Warning, "错误", "请先测试连接并登录")
                 return
 
             self.refresh_books_btn.setEnabled(False)
@@ -686,38 +877,56 @@ class ConfigDialog(QDialog):
             success, message, account_books = self.accounting_manager.get_account_books()
 
             if success and account_books:
-                # 清空现有选项
-                self.account_book_combo.clear()
-
-                # 添加账本选项
-                for book in account_books:
-                    display_text = book['name']
-                    if book['is_default']:
-                        display_text += " (默认)"
-                    self.account_book_combo.addItem(display_text, book['id'])
-
-                # 尝试选择之前保存的账本
-                if self.config_manager:
-                    config = self.config_manager.get_accounting_config()
-                    if hasattr(config, 'account_book_id') and config.account_book_id:
-                        index = self.account_book_combo.findData(config.account_book_id)
-                        if index >= 0:
-                            self.account_book_combo.setCurrentIndex(index)
+                # 批量更新期间屏蔽信号，避免每添加一项都触发选择变更（及配置写盘）
+                restored = False
+                self.account_book_combo.blockSignals(True)
+                self.account_book_combo.setUpdatesEnabled(False)
+                try:
+                    # 清空现有选项
+                    self.account_book_combo.clear()
+                    self._book_index_by_id = {}
+
+                    # 添加账本选项
+                    for index, book in enumerate(account_books):
+                        name = book['name']
+                        display_text = f"{name}{_DEFAULT_BOOK_SUFFIX}" if book['is_default'] else name
+                        self.account_book_combo.addItem(display_text, book['id'])
+                        self.account_book_combo.setItemData(index, name, _BOOK_NAME_ROLE)
+                        self._book_index_by_id[book['id']] = index
+
+                    # 尝试选择之前保存的账本
+                    if self.config_manager:
+                        config = self.config_manager.get_accounting_config()
+                        if hasattr(config, 'account_book_id') and config.account_book_id:
+                            index = self._book_index_by_id.get(config.account_book_id)
+                            if index is not None:
+                                self.account_book_combo.setCurrentIndex(index)
+                                restored = True
+                finally:
+                    self.account_book_combo.setUpdatesEnabled(True)
+                    self.account_book_combo.blockSignals(False)
+
+                # 只处理一次最终选择；恢复的是已保存的账本时无需再写回配置
+                self._loading_books = restored
+                try:
+                    self.on_account_book_changed()
+                finally:
+                    self._loading_books = False
 
                 self.account_status_label.setText(f"账本: 已加载 {len(account_books)} 个账本")
-                self.account_status_label.setStyleSheet("color: #22c55e; font-size: 11px;")
+                _set_label_state(self.account_status_label, "ok")
                 logger.info(f"成功获取 {len(account_books)} 个账本")
 
             else:
                 self.account_status_label.setText("账本: 获取失败")
-                self.account_status_label.setStyleSheet("color: #ef4444; font-size: 11px;")
-                QMessageBox.warning(self, "获取账本失败", message or "未知错误")
+                _set_label_state(self.account_status_label, "err")
+                self._show_message(QMessageBox.Icon.Warning, "获取账本失败", message or "未知错误")
 
         except Exception as e:
             logger.error(f"刷新账本列表失败: {e}")
             self.account_status_label.setText("账本: 刷新失败")
-            self.account_status_label.setStyleSheet("color: #ef4444; font-size: 11px;")
-            QMessageBox.warning(self, "错误", f"刷新账本列表失败: {str(e)}")
+            _set_label_state(self.account_status_label, "err")
+            self._show_message(QMessageBox.Icon.Warning, "错误", f"刷新账本列表失败: {str(e)}")
         finally:
             self.refresh_books_btn.setEnabled(True)
             self.refresh_books_btn.setText("刷新账本")
@@ -731,25 +940,48 @@ class ConfigDialog(QDialog):
             if current_text and current_data:
                 # 更新状态显示
                 self.account_status_label.setText(f"账本: {current_text}")
-                self.account_status_label.setStyleSheet("color: #22c55e; font-size: 11px;")
+                _set_label_state(self.account_status_label, "ok")
 
-                # 保存选择的账本到配置
-                if self.config_manager:
-                    self.config_manager.update_accounting_config(
-                        account_book_id=current_data,
-                        account_book_name=current_text.replace(" (默认)", "")
-                    )
+                # 保存选择的账本到配置（延迟写入，替换尚未写入的选择）
+                if self.config_manager and not self._loading_books:
+                    self._pending_book = (current_data, self.account_book_combo.currentData(_BOOK_NAME_ROLE))
+                    self._book_write_timer.start()
 
                 logger.info(f"选择账本: {current_text}")
             else:
                 self.account_status_label.setText("账本: 未选择")
-                self.account_status_label.setStyleSheet("color: #64748b; font-size: 11px;")
+                _set_label_state(self.account_status_label, "mute")
 
         except Exception as e:
             logger.error(f"账本选择变更处理失败: {e}")
+
+    def _flush_book_selection(self):
+        """将最后一次选择的账本写入配置"""
+        self._book_write_timer.stop()
+        if self._pending_book is None:
+            return
+
+        account_book_id, account_book_name = self._pending_book
+        self._pending_book = None
+        try:
+            self.config_manager.update_accounting_config(
+                account_book_id=account_book_id,
+                account_book_name=account_book_name
+            )
+        except Exception as e:
+            logger.error(f"保存账本选择失败: {e}")
+
+    def done(self, result):
+        """关闭对话框前写入尚未保存的账本选择"""
+        self._flush_book_selection()
+        super().done(result)
     
     def save_config(self):
         """保存配置"""
+        if not self._config_loaded:
+            self._show_message(QMessageBox.Icon.Warning, "错误", "配置加载失败，已取消保存以免覆盖现有配置")
+            return
+
         try:
             if self.config_type == "只为记账服务":
                 # 保存记账配置
@@ -762,60 +994,103 @@ class ConfigDialog(QDialog):
                 # 如果有选择账本，也保存账本信息
                 if hasattr(self, 'account_book_combo') and self.account_book_combo.currentData():
                     config_data['account_book_id'] = self.account_book_combo.currentData()
-                    config_data['account_book_name'] = self.account_book_combo.currentText().replace(" (默认)", "")
+                    config_data['account_book_name'] = self.account_book_combo.currentData(_BOOK_NAME_ROLE)
+
+                # 当前账本随本次保存一起写入，丢弃尚未写入的账本选择
+                self._pending_book = None
+                self._book_write_timer.stop()
 
                 success = self.config_manager.update_accounting_config(**config_data)
 
                 if success:
-                    QMessageBox.information(self, "成功", "记账服务配置保存成功！")
+                    self._show_message(QMessageBox.Icon.Information, "成功", "记账服务配置保存成功！")
                     self.accept()
                 else:
-                    QMessageBox.warning(self, "失败", "配置保存失败")
+                    self._show_message(QMessageBox.Icon.Warning, "失败", "配置保存失败")
                     
             elif self.config_type == "微信监控服务":
                 # 保存微信配置
                 # 获取监控会话列表
-                monitored_chats = []
-                for i in range(self.sessions_list.count()):
-                    monitored_chats.append(self.sessions_list.item(i).text())
+                monitored_chats = list(self._sessions_list_data)
 
                 # 获取选中的库类型
                 library_type = 'wxauto' if self.wxauto_radio.isChecked() else 'wxautox'
 
-                # 保存wxauto配置
-                wxauto_success = self.config_manager.update_wxauto_config(
-                    library_type=library_type
-                )
-
-                # 保存微信监控配置
-                wechat_success = self.config_manager.update_wechat_monitor_config(
-                    enabled=self.enabled_check.isChecked(),
-                    monitored_chats=monitored_chats,
-                    auto_reply=self.auto_reply_check.isChecked(),
-                    reply_template=self.template_edit.text().strip()
-                )
-
-                # 保存监听间隔到服务监控配置
-                service_success = self.config_manager.update_service_monitor_config(
-                    message_check_interval=self.interval_spinbox.value()
-                )
-
-                success = wxauto_success and wechat_success and service_success
+                # 一次性保存wxauto配置、微信监控配置和监听间隔（只写一次配置文件）
+                success = self.config_manager.update_config({
+                    'wxauto': {
+                        'library_type': library_type
+                    },
+                    'wechat_monitor': {
+                        'enabled': self.enabled_check.isChecked(),
+                        'monitored_chats': monitored_chats,
+                        'auto_reply': self.auto_reply_check.isChecked(),
+                        'reply_template': self.template_edit.text().strip()
+                    },
+                    'service_monitor': {
+                        'message_check_interval': self.interval_spinbox.value()
+                    }
+                })
                 
                 if success:
-                    QMessageBox.information(self, "成功", "微信监控配置保存成功！")
+                    self._show_message(QMessageBox.Icon.Information, "成功", "微信监控配置保存成功！")
                     self.accept()
                 else:
-                    QMessageBox.warning(self, "失败", "配置保存失败")
+                    self._show_message(QMessageBox.Icon.Warning, "失败", "配置保存失败")
                     
         except Exception as e:
             logger.error(f"保存配置失败: {e}")
-            QMessageBox.warning(self, "错误", f"保存配置失败: {str(e)}")
+            self._show_message(QMessageBox.Icon.Warning, "错误", f"保存配置失败: {str(e)}")
 
 
 class LegacyMainWindow(QMainWindow):
     """旧版主窗口 - 集成新模块化架构"""
-    
+
+    # 模块启动顺序（显示名称, 属性名），关闭时按相反顺序停止
+    _MODULE_ORDER = (
+        ("配置管理器", "config_manager"),
+        ("日志管理器", "log_manager"),
+        ("wxauto管理器", "wxauto_manager"),
+        ("记账管理器", "accounting_manager"),
+        ("微信服务管理器", "wechat_service_manager"),
+        ("消息监听器", "message_listener"),
+        ("消息投递服务", "message_delivery"),
+        ("服务监控器", "service_monitor"),
+    )
+
+    # 标题与进度标签样式表（类级常量，构建窗口时无需重新构造）
+    _TITLE_QSS = """
+        QLabel {
+            color: white;
+            font-size: 28px;
+            font-weight: bold;
+            margin: 20px 0;
+        }
+    """
+
+    _PROGRESS_QSS = """
+        QLabel {
+            color: #f59e0b;
+            font-size: 14px;
+            font-weight: bold;
+            margin: 10px 0;
+            padding: 5px;
+            background: rgba(245, 158, 11, 0.1);
+            border-radius: 5px;
+            min-height: 20px;
+        }
+    """
+
+    # 注册到服务监控器的模块（属性名即服务名）
+    _MONITORED_SERVICES = (
+        "accounting_manager",
+        "wxauto_manager",
+        "wechat_service_manager",
+        "message_listener",
+        "message_delivery",
+        "log_manager",
+    )
+
     def __init__(self):
         super().__init__()
         
@@ -832,14 +1107,24 @@ class LegacyMainWindow(QMainWindow):
         # UI状态
         self.is_monitoring = False
         self.monitored_chats = []
-        
-        # 统计数据
-        self.stats = {
-            'total_processed': 0,
-            'successful_accounting': 0,
-            'failed_accounting': 0,
-            'irrelevant_messages': 0
-        }
+
+        # 模块信号是否已连接
+        self._connections_ready = False
+
+        # 启动过程中的错误（事件循环启动后汇总提示一次）
+        self._startup_errors = []
+
+        # 已构建的配置对话框（按配置类型缓存）
+        self._config_dialogs = {}
+
+        # 统一统计系统实例（首次刷新时获取）
+        self._unified_stats = None
+
+        # 统计刷新去抖：消息突发时合并多次刷新请求，只查询和重绘一次
+        self._stats_refresh_timer = QTimer(self)
+        self._stats_refresh_timer.setSingleShot(True)
+        self._stats_refresh_timer.setInterval(150)
+        self._stats_refresh_timer.timeout.connect(self._do_refresh_stats)
         
         # 初始化
         self.init_modules()
@@ -847,56 +1132,57 @@ class LegacyMainWindow(QMainWindow):
         self.setup_connections()
         self.start_modules()
 
+        # 窗口显示后再汇总提示启动错误，避免在构造函数中弹出模态对话框
+        if self._startup_errors:
+            QTimer.singleShot(0, self._show_startup_errors)
+
         # 加载统一统计数据
         self.load_unified_statistics()
 
         logger.info("旧版UI主窗口初始化完成（使用新模块化架构）")
 
-    def load_unified_statistics(self):
-        """从统一统计系统加载初始统计数据"""
-        try:
-            # 获取统一统计系统
-            unified_stats = get_unified_statistics()
-            stats = unified_stats.get_statistics()
-
-            # 更新本地统计数据
-            self.stats['total_processed'] = stats.total_processed
-            self.stats['successful_accounting'] = stats.accounting_success
-            self.stats['failed_accounting'] = stats.accounting_failed
-            self.stats['irrelevant_messages'] = stats.accounting_irrelevant
-
-            # 更新UI显示
-            self.update_stats_display()
-
-            logger.info(f"加载统一统计数据: 处理={stats.total_processed}, 成功={stats.accounting_success}, 失败={stats.accounting_failed}, 无关={stats.accounting_irrelevant}")
-
-        except Exception as e:
-            logger.error(f"加载统一统计数据失败: {e}")
+    def _show_startup_errors(self):
+        """汇总显示启动过程中的错误"""
+        errors, self._startup_errors = self._startup_errors, []
+        if errors:
+            self.update_progress(errors[-1])
+            QMessageBox.warning(self, "启动警告", "\n".join(errors))
 
     def refresh_stats_from_unified_system(self):
+        """请求刷新统计数据（去抖，窗口内的多次请求只刷新一次）"""
+        if not self._stats_refresh_timer.isActive():
+            self._stats_refresh_timer.start()
+
+    def _do_refresh_stats(self):
         """从统一统计系统刷新统计数据"""
         try:
-            # 获取统一统计系统
-            unified_stats = get_unified_statistics()
-            stats = unified_stats.get_statistics()
-
-            # 更新本地统计数据
-            self.stats['total_processed'] = stats.total_processed
-            self.stats['successful_accounting'] = stats.accounting_success
-            self.stats['failed_accounting'] = stats.accounting_failed
-            self.stats['irrelevant_messages'] = stats.accounting_irrelevant
+            # 获取统一统计系统（首次刷新时获取并缓存全局实例）
+            if self._unified_stats is None:
+                from app.utils.unified_statistics import get_unified_statistics
+                self._unified_stats = get_unified_statistics()
+            stats = self._unified_stats.get_statistics()
 
-            # 更新UI显示
-            self.update_stats_display()
+            # 直接用统计结果更新UI显示
+            self.update_stats_display(stats)
 
             logger.debug(f"刷新统计数据: 处理={stats.total_processed}, 成功={stats.accounting_success}, 失败={stats.accounting_failed}, 无关={stats.accounting_irrelevant}")
 
         except Exception as e:
             logger.error(f"刷新统计数据失败: {e}")
 
+    # 初始加载立即执行，不经过去抖
+    load_unified_statistics = _do_refresh_stats
+
     def init_modules(self):
         """初始化所有模块"""
         try:
+            # 导入新的模块化组件
+            from app.modules import (
+                ConfigManager, AccountingManager, WechatServiceManager,
+                WxautoManager, MessageListener, MessageDelivery,
+                LogManager, ServiceMonitor
+            )
+
             # 1. 配置管理器（最先初始化）
             self.config_manager = ConfigManager(parent=self)
             
@@ -935,7 +1221,7 @@ class LegacyMainWindow(QMainWindow):
             
         except Exception as e:
             logger.error(f"模块初始化失败: {e}")
-            QMessageBox.critical(self, "错误", f"模块初始化失败: {str(e)}")
+            self._startup_errors.append(f"模块初始化失败: {str(e)}")
     
     def init_ui(self):
         """初始化UI - 使用增强版美化组件"""
@@ -954,19 +1240,12 @@ class LegacyMainWindow(QMainWindow):
         # 标题
         title_label = QLabel("只为记账--微信助手")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 28px;
-                font-weight: bold;
-                margin: 20px 0;
-            }
-        """)
+        title_label.setStyleSheet(LegacyMainWindow._TITLE_QSS)
         main_layout.addWidget(title_label)
 
         # 状态指示器区域
         status_layout = QHBoxLayout()
-        status_layout.setSpacing(20)
+        status_layout.setSpacing(10)  # 指示器自带阴影边距，卡片间的可见间距不变
 
         # 只为记账服务状态
         self.accounting_indicator = EnhancedStatusIndicator(
@@ -1003,26 +1282,20 @@ class LegacyMainWindow(QMainWindow):
         # 进度显示标签
         self.progress_label = QLabel("")
         self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.progress_label.setStyleSheet("""
-            QLabel {
-                color: #f59e0b;
-                font-size: 14px;
-                font-weight: bold;
-                margin: 10px 0;
-                padding: 5px;
-                background: rgba(245, 158, 11, 0.1);
-                border-radius: 5px;
-                min-height: 20px;
-            }
-        """)
+        self.progress_label.setStyleSheet(LegacyMainWindow._PROGRESS_QSS)
         self.progress_label.hide()  # 初始隐藏
         button_layout.addWidget(self.progress_label)
 
+        # 进度标签自动隐藏定时器（复用同一个定时器，新消息会重新计时）
+        self._progress_hide_timer = QTimer(self)
+        self._progress_hide_timer.setSingleShot(True)
+        self._progress_hide_timer.timeout.connect(self.progress_label.hide)
+
         main_layout.addLayout(button_layout)
 
         # 统计卡片区域
         stats_layout = QHBoxLayout()
-        stats_layout.setSpacing(15)
+        stats_layout.setSpacing(5)  # 统计卡片自带阴影边距，卡片间的可见间距不变
 
         self.processed_card = EnhancedStatCard("处理消息数", 0)
         self.success_card = EnhancedStatCard("成功记账数", 0)
@@ -1048,90 +1321,45 @@ class LegacyMainWindow(QMainWindow):
         # 启动纹理动画（可选）
         # self.textured_background.start_texture_animation()
 
-    def open_config_dialog(self, config_type):
-        """打开配置对话框"""
-        try:
-            dialog = ConfigDialog(config_type, self.config_manager, self.accounting_manager, self)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                # 配置已保存，更新UI状态
-                self.update_ui_from_config()
-                logger.info(f"{config_type}配置已更新")
-        except Exception as e:
-            logger.error(f"打开配置对话框失败: {e}")
-            QMessageBox.warning(self, "错误", f"打开配置失败: {str(e)}")
-
-    def show_logs(self):
-        """显示日志窗口"""
-        try:
-            if not hasattr(self, 'log_window') or self.log_window is None:
-                from app.qt_ui.enhanced_log_window import EnhancedLogWindow
-                self.log_window = EnhancedLogWindow(self.log_manager, self)
-
-            self.log_window.show()
-            self.log_window.raise_()
-            self.log_window.activateWindow()
-
-        except Exception as e:
-            logger.error(f"显示日志窗口失败: {e}")
-            QMessageBox.warning(self, "错误", f"显示日志窗口失败: {str(e)}")
-
-    def update_stats_display(self):
-        """更新统计显示"""
-        try:
-            self.total_card.set_value(self.stats['total_processed'])
-            self.success_card.set_value(self.stats['successful_accounting'])
-            self.failed_card.set_value(self.stats['failed_accounting'])
-            self.irrelevant_card.set_value(self.stats['irrelevant_messages'])
-        except Exception as e:
-            logger.error(f"更新统计显示失败: {e}")
-
-
-
-
-
-
-
     def setup_connections(self):
         """设置信号连接"""
-        try:
-            # 配置管理器信号
-            if self.config_manager:
-                self.config_manager.config_loaded.connect(self.on_config_loaded)
-                self.config_manager.config_changed.connect(self.on_config_changed)
-
-            # 记账管理器信号
-            if self.accounting_manager:
-                self.accounting_manager.login_completed.connect(self.on_accounting_login)
-                self.accounting_manager.accounting_completed.connect(self.on_accounting_completed)
-
-            # 微信服务管理器信号
-            if self.wechat_service_manager:
-                self.wechat_service_manager.monitoring_started.connect(self.on_monitoring_started)
-                self.wechat_service_manager.monitoring_stopped.connect(self.on_monitoring_stopped)
-                self.wechat_service_manager.stats_updated.connect(self.on_stats_updated)
-
-            # wxauto管理器信号
-            if self.wxauto_manager:
-                self.wxauto_manager.instance_initialized.connect(self.on_wxauto_initialized)
-                self.wxauto_manager.connection_status_changed.connect(self.on_wxauto_connection_changed)
-
-            # 消息监听器信号
-            if self.message_listener:
-                self.message_listener.new_message_received.connect(self.on_new_message)
-                self.message_listener.listening_started.connect(self.on_listening_started)
-                self.message_listener.listening_stopped.connect(self.on_listening_stopped)
+        # 只连接一次，重复调用不会让处理函数被触发多次
+        if self._connections_ready:
+            return
 
-            # 消息投递服务信号
-            if self.message_delivery:
-                self.message_delivery.accounting_completed.connect(self.on_delivery_accounting_completed)
-                self.message_delivery.wechat_reply_sent.connect(self.on_wechat_reply_sent)
+        try:
+            connections = (
+                # 配置管理器信号
+                (self.config_manager, 'config_loaded', self.on_config_loaded),
+                (self.config_manager, 'config_changed', self.on_config_changed),
+                # 记账管理器信号
+                (self.accounting_manager, 'login_completed', self.on_accounting_login),
+                (self.accounting_manager, 'accounting_completed', self.on_accounting_completed),
+                # 微信服务管理器信号
+                (self.wechat_service_manager, 'monitoring_started', self.on_monitoring_started),
+                (self.wechat_service_manager, 'monitoring_stopped', self.on_monitoring_stopped),
+                (self.wechat_service_manager, 'stats_updated', self.on_stats_updated),
+                # wxauto管理器信号
+                (self.wxauto_manager, 'instance_initialized', self.on_wxauto_initialized),
+                (self.wxauto_manager, 'connection_status_changed', self.on_wxauto_connection_changed),
+                # 消息监听器信号
+                (self.message_listener, 'new_message_received', self.on_new_message),
+                (self.message_listener, 'listening_started', self.on_listening_started),
+                (self.message_listener, 'listening_stopped', self.on_listening_stopped),
+                # 消息投递服务信号
+                (self.message_delivery, 'accounting_completed', self.on_delivery_accounting_completed),
+                (self.message_delivery, 'wechat_reply_sent', self.on_wechat_reply_sent),
+                # 服务监控器信号
+                (self.service_monitor, 'service_status_changed', self.on_service_status_changed),
+                (self.service_monitor, 'service_failed', self.on_service_failed),
+                (self.service_monitor, 'service_recovered', self.on_service_recovered),
+            )
 
-            # 服务监控器信号
-            if self.service_monitor:
-                self.service_monitor.service_status_changed.connect(self.on_service_status_changed)
-                self.service_monitor.service_failed.connect(self.on_service_failed)
-                self.service_monitor.service_recovered.connect(self.on_service_recovered)
+            for source, signal_name, slot in connections:
+                if source is not None:
+                    getattr(source, signal_name).connect(slot)
 
+            self._connections_ready = True
             logger.info("信号连接设置完成")
 
         except Exception as e:
@@ -1141,24 +1369,14 @@ class LegacyMainWindow(QMainWindow):
         """启动所有模块"""
         try:
             # 按依赖顺序启动模块
-            modules_to_start = [
-                ("配置管理器", self.config_manager),
-                ("日志管理器", self.log_manager),
-                ("wxauto管理器", self.wxauto_manager),
-                ("记账管理器", self.accounting_manager),
-                ("微信服务管理器", self.wechat_service_manager),
-                ("消息监听器", self.message_listener),
-                ("消息投递服务", self.message_delivery),
-                ("服务监控器", self.service_monitor)
-            ]
-
-            for name, module in modules_to_start:
+            for name, attr in self._MODULE_ORDER:
+                module = getattr(self, attr)
                 if module:
                     if module.start():
                         logger.info(f"{name}启动成功")
                     else:
                         logger.error(f"{name}启动失败")
-                        QMessageBox.warning(self, "警告", f"{name}启动失败")
+                        self._startup_errors.append(f"{name}启动失败")
 
             # 注册服务到监控器
             self.register_services_to_monitor()
@@ -1171,7 +1389,7 @@ class LegacyMainWindow(QMainWindow):
 
         except Exception as e:
             logger.error(f"启动模块失败: {e}")
-            QMessageBox.critical(self, "错误", f"启动模块失败: {str(e)}")
+            self._startup_errors.append(f"启动模块失败: {str(e)}")
 
     def register_services_to_monitor(self):
         """注册服务到监控器"""
@@ -1180,16 +1398,8 @@ class LegacyMainWindow(QMainWindow):
                 return
 
             # 注册各个服务
-            services = [
-                ("accounting_manager", self.accounting_manager),
-                ("wxauto_manager", self.wxauto_manager),
-                ("wechat_service_manager", self.wechat_service_manager),
-                ("message_listener", self.message_listener),
-                ("message_delivery", self.message_delivery),
-                ("log_manager", self.log_manager)
-            ]
-
-            for service_name, service in services:
+            for service_name in self._MONITORED_SERVICES:
+                service = getattr(self, service_name)
                 if service:
                     self.service_monitor.register_service(
                         service_name,
@@ -1265,14 +1475,19 @@ class LegacyMainWindow(QMainWindow):
 
     def on_new_message(self, chat_name, message_data):
         """收到新消息"""
-        logger.info(f"收到新消息: {chat_name} - {message_data.get('sender', '')} - {message_data.get('content', '')[:50]}...")
+        content = message_data.get('content', '')
+        sender = message_data.get('sender', '')
+
+        # 日志级别过滤掉INFO时不再格式化消息
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"收到新消息: {chat_name} - {sender} - {content[:50]}...")
 
         # 发送到消息投递服务处理
         if self.message_delivery:
             success, message = self.message_delivery.process_message(
                 chat_name,
-                message_data.get('content', ''),
-                message_data.get('sender_remark', message_data.get('sender', ''))
+                content,
+                message_data.get('sender_remark', sender)
             )
             if success:
                 logger.info(f"消息已加入处理队列: {message}")
@@ -1327,23 +1542,28 @@ class LegacyMainWindow(QMainWindow):
             # 更新监控聊天列表
             monitored_chats = config.wechat_monitor.monitored_chats
             if monitored_chats != self.monitored_chats:
-                self.monitored_chats = monitored_chats
+                new_chats = set(monitored_chats)
+                old_chats = set(self.monitored_chats)
+                self.monitored_chats = list(monitored_chats)
 
-                # 更新微信服务管理器
+                # 只把变化的部分同步到微信服务管理器
                 if self.wechat_service_manager:
                     for chat in monitored_chats:
-                        self.wechat_service_manager.add_chat(chat)
+                        if chat not in old_chats:
+                            self.wechat_service_manager.add_chat(chat)
+                    for chat in old_chats - new_chats:
+                        self.wechat_service_manager.remove_chat(chat)
 
             logger.debug("UI已根据配置更新")
 
         except Exception as e:
             logger.error(f"根据配置更新UI失败: {e}")
 
-    def update_stats_display(self):
+    def update_stats_display(self, stats):
         """更新统计显示"""
-        self.processed_card.set_value(self.stats['total_processed'])
-        self.success_card.set_value(self.stats['successful_accounting'])
-        self.failed_card.set_value(self.stats['failed_accounting'])
+        self.processed_card.set_value(stats.total_processed)
+        self.success_card.set_value(stats.accounting_success)
+        self.failed_card.set_value(stats.accounting_failed)
 
     def update_progress(self, message: str):
         """更新进度显示"""
@@ -1354,6 +1574,10 @@ class LegacyMainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"更新进度显示失败: {e}")
 
+    def _hide_progress_later(self, ms=3000):
+        """延迟隐藏进度标签"""
+        self._progress_hide_timer.start(ms)
+
     # 用户交互方法
 
     def toggle_monitoring(self):
@@ -1367,10 +1591,10 @@ class LegacyMainWindow(QMainWindow):
                     self.main_button.set_listening_state(True)
                     self.update_progress("监控已启动")
                     # 3秒后隐藏进度标签
-                    QTimer.singleShot(3000, lambda: self.progress_label.hide() if hasattr(self, 'progress_label') else None)
+                    self._hide_progress_later()
                 else:
                     self.update_progress("监控启动失败")
-                    QTimer.singleShot(3000, lambda: self.progress_label.hide() if hasattr(self, 'progress_label') else None)
+                    self._hide_progress_later()
             else:
                 # 停止监控
                 self.update_progress("正在停止监控...")
@@ -1378,15 +1602,15 @@ class LegacyMainWindow(QMainWindow):
                     self.is_monitoring = False
                     self.main_button.set_listening_state(False)
                     self.update_progress("监控已停止")
-                    QTimer.singleShot(3000, lambda: self.progress_label.hide() if hasattr(self, 'progress_label') else None)
+                    self._hide_progress_later()
                 else:
                     self.update_progress("监控停止失败")
-                    QTimer.singleShot(3000, lambda: self.progress_label.hide() if hasattr(self, 'progress_label') else None)
+                    self._hide_progress_later()
 
         except Exception as e:
             logger.error(f"切换监控状态失败: {e}")
             self.update_progress(f"操作失败: {str(e)}")
-            QTimer.singleShot(3000, lambda: self.progress_label.hide() if hasattr(self, 'progress_label') else None)
+            self._hide_progress_later()
             QMessageBox.warning(self, "错误", f"切换监控状态失败: {str(e)}")
 
     def start_monitoring(self) -> bool:
@@ -1454,13 +1678,19 @@ class LegacyMainWindow(QMainWindow):
     def open_config_dialog(self, config_type):
         """打开配置对话框"""
         try:
-            dialog = ConfigDialog(
-                config_type,
-                config_manager=self.config_manager,
-                accounting_manager=self.accounting_manager,
-                wechat_service_manager=self.wechat_service_manager,
-                parent=self
-            )
+            # 每种配置对话框只构建一次，再次打开时重新加载当前配置
+            dialog = self._config_dialogs.get(config_type)
+            if dialog is None:
+                dialog = ConfigDialog(
+                    config_type,
+                    config_manager=self.config_manager,
+                    accounting_manager=self.accounting_manager,
+                    wechat_service_manager=self.wechat_service_manager,
+                    parent=self
+                )
+                self._config_dialogs[config_type] = dialog
+            else:
+                dialog.load_current_config()
 
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 logger.info(f"{config_type}配置已更新")
@@ -1480,7 +1710,7 @@ class LegacyMainWindow(QMainWindow):
                 return
 
             # 创建新的日志窗口（不设置父窗口，确保独立显示）
-            self.log_window = EnhancedLogWindow(parent=None)
+            self.log_window = _log_window_class()(parent=None)
 
             # 设置窗口位置（相对于主窗口偏移）
             try:
@@ -1512,19 +1742,9 @@ class LegacyMainWindow(QMainWindow):
             if self.is_monitoring:
                 self.stop_monitoring()
 
-            # 停止所有模块
-            modules_to_stop = [
-                ("服务监控器", self.service_monitor),
-                ("消息投递服务", self.message_delivery),
-                ("消息监听器", self.message_listener),
-                ("微信服务管理器", self.wechat_service_manager),
-                ("记账管理器", self.accounting_manager),
-                ("wxauto管理器", self.wxauto_manager),
-                ("日志管理器", self.log_manager),
-                ("配置管理器", self.config_manager)
-            ]
-
-            for name, module in modules_to_stop:
+            # 停止所有模块（与启动顺序相反）
+            for name, attr in reversed(self._MODULE_ORDER):
+                module = getattr(self, attr)
                 if module:
                     try:
                         module.stop()
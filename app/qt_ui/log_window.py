@@ -2,8 +2,9 @@ import sys
 import logging
 import re
 import json
+from collections import deque
 from datetime import datetime
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
                              QPushButton, QCheckBox, QLabel, QFrame, QSplitter,
                              QGroupBox, QScrollArea, QApplication, QLineEdit,
                              QComboBox, QFileDialog, QMessageBox, QProgressBar,
@@ -13,21 +14,53 @@ from PyQt6.QtGui import QFont, QTextCursor, QColor, QPalette, QTextCharFormat
 
 from app.logs import log_memory_handler, logger, log_signal_emitter
 
+# 日志行中的级别标识，一次扫描匹配所有级别
+_LEVEL_RE = re.compile(r'\[(DEBUG|INFO|WARNING|ERROR|CRITICAL)\]')
 
-class EnhancedLogDisplayWidget(QTextEdit):
+# 无级别标识时按关键词推断级别（按优先级排列）
+_LEVEL_KEYWORDS = (
+    ('ERROR', ('error', '错误', 'failed', '失败')),
+    ('WARNING', ('warning', '警告', 'warn')),
+    ('DEBUG', ('debug', '调试')),
+)
+
+
+class EnhancedLogDisplayWidget(QPlainTextEdit):
     """增强的日志显示组件"""
 
+    # 日志级别对应的颜色
+    LOG_COLORS = {
+        'DEBUG': '#9cdcfe',    # 浅蓝色
+        'INFO': '#d4d4d4',     # 白色
+        'WARNING': '#dcdcaa',  # 黄色
+        'ERROR': '#f44747',    # 红色
+        'CRITICAL': '#ff6b6b'  # 亮红色
+    }
+    DEFAULT_LOG_COLOR = '#d4d4d4'
+    TIMESTAMP_COLOR = '#888888'
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
 
+        # 预先创建的各级别文本格式（每条日志直接复用）
+        self._level_formats = {
+            level: self._char_format(color) for level, color in self.LOG_COLORS.items()
+        }
+        self._default_format = self._char_format(self.DEFAULT_LOG_COLOR)
+        self._timestamp_format = self._char_format(self.TIMESTAMP_COLOR)
+
+        # 性能优化：超过最大行数时由文档自动丢弃最早的行
+        self.max_display_lines = 5000
+        self.setMaximumBlockCount(self.max_display_lines)
+
         # 字体设置
         self.base_font_size = 11
         self.current_font_size = self.base_font_size
         self.font_family = "Consolas"
         self.update_font()
 
-        # 设置样式
+        # 设置样式（只设置一次，字体大小由 update_font 单独控制）
         self.update_style()
 
         # 自动滚动到底部
@@ -35,14 +68,10 @@ class EnhancedLogDisplayWidget(QTextEdit):
         self.user_scrolled_up = False  # 用户是否手动向上滚动
         self.last_scroll_position = 0  # 上次滚动位置
 
-        # 记录当前显示的日志数量，用于性能优化
-        self.displayed_log_count = 0
         # 搜索相关
         self.search_query = ""
         self.search_results = []
         self.current_search_index = -1
-        # 性能优化
-        self.max_display_lines = 5000
         # 线程安全
         self.mutex = QMutex()
 
@@ -77,37 +106,49 @@ class EnhancedLogDisplayWidget(QTextEdit):
         if scrollbar.value() >= scrollbar.maximum() - 10:
             self.user_scrolled_up = False
 
+    @property
+    def displayed_log_count(self):
+        """当前显示的日志行数（文档末尾保留一个空行）"""
+        return max(self.blockCount() - 1, 0)
+
+    @staticmethod
+    def _char_format(color):
+        """创建指定颜色的文本格式"""
+        fmt = QTextCharFormat()
+        fmt.setForeground(QColor(color))
+        return fmt
+
     def update_font(self):
-        """更新字体"""
-        font = QFont(self.font_family, self.current_font_size)
+        """更新字体（缩放时只改字体，不重新解析样式表）"""
+        font = QFont(self.font_family)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        font.setPixelSize(self.current_font_size)
         self.setFont(font)
     
     def update_style(self):
-        """更新样式"""
-        self.setStyleSheet(f"""
-            QTextEdit {{
+        """更新样式（样式表中不包含字体，避免覆盖 setFont）"""
+        self.setStyleSheet("""
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #d4d4d4;
                 border: 1px solid #3e3e3e;
                 border-radius: 4px;
                 padding: 8px;
-                font-family: '{self.font_family}', 'Monaco', monospace;
-                font-size: {self.current_font_size}px;
                 line-height: 1.4;
-            }}
-            QScrollBar:vertical {{
+            }
+            QScrollBar:vertical {
                 background-color: #2d2d2d;
                 width: 12px;
                 border-radius: 6px;
-            }}
-            QScrollBar::handle:vertical {{
+            }
+            QScrollBar::handle:vertical {
                 background-color: #555555;
                 border-radius: 6px;
                 min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
+            }
+            QScrollBar::handle:vertical:hover {
                 background-color: #666666;
-            }}
+            }
         """)
     
     def zoom_in(self):
@@ -115,49 +156,32 @@ class EnhancedLogDisplayWidget(QTextEdit):
         if self.current_font_size < 24:  # 最大字体大小限制
             self.current_font_size += 1
             self.update_font()
-            self.update_style()
     
     def zoom_out(self):
         """缩小字体"""
         if self.current_font_size > 8:  # 最小字体大小限制
             self.current_font_size -= 1
             self.update_font()
-            self.update_style()
     
     def reset_zoom(self):
         """重置字体大小"""
         self.current_font_size = self.base_font_size
         self.update_font()
-        self.update_style()
         
     def append_log(self, log_text, log_level, timestamp=None):
         """添加日志文本（线程安全）"""
         with QMutexLocker(self.mutex):
             try:
-                # 根据日志级别设置颜色
-                color = self.get_log_color(log_level)
-
                 # 移动到文档末尾
                 cursor = self.textCursor()
                 cursor.movePosition(QTextCursor.MoveOperation.End)
 
-                # 转义HTML特殊字符
-                escaped_text = log_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
                 # 添加时间戳（如果提供）
                 if timestamp:
-                    time_color = "#888888"
-                    cursor.insertHtml(f'<span style="color: {time_color};">[{timestamp}]</span> ')
-
-                # 插入带颜色的文本
-                cursor.insertHtml(f'<span style="color: {color};">{escaped_text}</span><br>')
-
-                # 增加显示计数
-                self.displayed_log_count += 1
+                    cursor.insertText(f"[{timestamp}] ", self._timestamp_format)
 
-                # 如果日志太多，清理旧的日志以保持性能
-                if self.displayed_log_count > self.max_display_lines:
-                    self.trim_logs()
+                # 插入带颜色的文本（纯文本插入，无需转义和HTML解析）
+                cursor.insertText(f"{log_text}\n", self._level_formats.get(log_level, self._default_format))
 
                 # 智能自动滚动到底部
                 if self.auto_scroll and not self.user_scrolled_up:
@@ -173,7 +197,11 @@ class EnhancedLogDisplayWidget(QTextEdit):
                 cursor = self.textCursor()
                 cursor.movePosition(QTextCursor.MoveOperation.End)
 
-                html_content = ""
+                # 整批插入作为一次编辑，只触发一次布局更新
+                level_formats = self._level_formats
+                default_format = self._default_format
+                timestamp_format = self._timestamp_format
+                cursor.beginEditBlock()
                 for entry in log_entries:
                     if isinstance(entry, dict):
                         log_text = entry.get('message', '')
@@ -184,21 +212,11 @@ class EnhancedLogDisplayWidget(QTextEdit):
                         log_level = 'INFO'
                         timestamp = ''
 
-                    color = self.get_log_color(log_level)
-                    escaped_text = log_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-
                     if timestamp:
-                        time_color = "#888888"
-                        html_content += f'<span style="color: {time_color};">[{timestamp}]</span> '
-
-                    html_content += f'<span style="color: {color};">{escaped_text}</span><br>'
-                    self.displayed_log_count += 1
+                        cursor.insertText(f"[{timestamp}] ", timestamp_format)
 
-                cursor.insertHtml(html_content)
-
-                # 如果日志太多，清理旧的日志
-                if self.displayed_log_count > self.max_display_lines:
-                    self.trim_logs()
+                    cursor.insertText(f"{log_text}\n", level_formats.get(log_level, default_format))
+                cursor.endEditBlock()
 
                 # 智能自动滚动到底部
                 if self.auto_scroll and not self.user_scrolled_up:
@@ -323,39 +341,9 @@ class EnhancedLogDisplayWidget(QTextEdit):
         cursor.movePosition(QTextCursor.MoveOperation.End)
         self.setTextCursor(cursor)
     
-    def trim_logs(self):
-        """清理旧的日志以保持性能"""
-        try:
-            # 获取当前文档
-            document = self.document()
-            cursor = QTextCursor(document)
-            
-            # 移动到文档开始
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            
-            # 删除前面的一半日志
-            lines_to_delete = self.displayed_log_count // 2
-            for _ in range(lines_to_delete):
-                cursor.select(QTextCursor.SelectionType.LineUnderCursor)
-                cursor.removeSelectedText()
-                cursor.deleteChar()  # 删除换行符
-            
-            # 更新计数
-            self.displayed_log_count = self.displayed_log_count - lines_to_delete
-            
-        except Exception as e:
-            print(f"清理日志失败: {e}")
-    
     def get_log_color(self, log_level):
         """根据日志级别获取颜色"""
-        colors = {
-            'DEBUG': '#9cdcfe',    # 浅蓝色
-            'INFO': '#d4d4d4',     # 白色
-            'WARNING': '#dcdcaa',  # 黄色
-            'ERROR': '#f44747',    # 红色
-            'CRITICAL': '#ff6b6b'  # 亮红色
-        }
-        return colors.get(log_level, '#d4d4d4')
+        return self.LOG_COLORS.get(log_level, self.DEFAULT_LOG_COLOR)
     
     def export_logs(self, filename, level_filter=None):
         """导出日志到文件"""
@@ -397,7 +385,6 @@ class EnhancedLogDisplayWidget(QTextEdit):
         """清空日志"""
         with QMutexLocker(self.mutex):
             self.clear()
-            self.displayed_log_count = 0
             self.search_results = []
             self.current_search_index = -1
 
@@ -844,6 +831,16 @@ class LogWindow(QWidget):
             }
         """)
         
+        # 实时日志计数（用于控制统计信息的更新频率）
+        self._new_log_count = 0
+
+        # 实时日志缓冲：短时间内到达的日志合并为一次插入
+        self._pending_logs = deque(maxlen=5000)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(60)
+        self._flush_timer.timeout.connect(self.flush_pending_logs)
+
         self.setup_ui()
         self.setup_connections()
         
@@ -1474,15 +1471,34 @@ class LogWindow(QWidget):
             # 获取时间戳
             timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
 
-            # 添加到显示
-            self.log_display.append_log(log_text, log_level, timestamp)
+            # 加入缓冲区，由定时器合并插入
+            self._pending_logs.append({'message': log_text, 'level': log_level, 'timestamp': timestamp})
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+        except Exception as e:
+            print(f"处理新日志失败: {e}")
+
+    def flush_pending_logs(self):
+        """将缓冲的实时日志一次性添加到显示"""
+        try:
+            if not self._pending_logs:
+                return
+
+            entries = list(self._pending_logs)
+            self._pending_logs.clear()
 
-            # 定期更新统计信息（避免频繁更新）
-            if self.log_display.displayed_log_count % 50 == 0:
+            # 一次编辑块插入整批日志，只滚动一次
+            self.log_display.append_log_batch(entries)
+
+            # 定期更新统计信息（每累计50条更新一次，避免频繁更新）
+            previous = self._new_log_count
+            self._new_log_count += len(entries)
+            if self._new_log_count // 50 != previous // 50:
                 self.update_statistics()
 
         except Exception as e:
-            print(f"处理新日志失败: {e}")
+            print(f"刷新实时日志失败: {e}")
     
     def is_level_enabled(self, log_level):
         """检查日志级别是否启用"""
@@ -1530,6 +1546,10 @@ class LogWindow(QWidget):
     def refresh_logs(self):
         """刷新日志显示"""
         try:
+            # 丢弃待刷新的实时日志，它们已包含在即将重新加载的历史日志中
+            self._flush_timer.stop()
+            self._pending_logs.clear()
+
             # 获取启用的日志级别
             enabled_levels = []
             if self.debug_cb.isChecked():
@@ -1573,32 +1593,24 @@ class LogWindow(QWidget):
     
     def extract_log_level(self, log_line):
         """从日志行中提取日志级别"""
-        # 匹配日志级别的正则表达式
-        level_patterns = [
-            r'\[DEBUG\]',
-            r'\[INFO\]', 
-            r'\[WARNING\]',
-            r'\[ERROR\]',
-            r'\[CRITICAL\]'
-        ]
-        
-        for pattern in level_patterns:
-            if re.search(pattern, log_line):
-                return pattern.strip('[]')
-        
+        match = _LEVEL_RE.search(log_line)
+        if match:
+            return match.group(1)
+
         # 如果没有找到明确的级别标识，根据关键词判断
-        if any(keyword in log_line.lower() for keyword in ['error', '错误', 'failed', '失败']):
-            return 'ERROR'
-        elif any(keyword in log_line.lower() for keyword in ['warning', '警告', 'warn']):
-            return 'WARNING'
-        elif any(keyword in log_line.lower() for keyword in ['debug', '调试']):
-            return 'DEBUG'
-        else:
-            return 'INFO'
+        lowered = log_line.lower()
+        for level, keywords in _LEVEL_KEYWORDS:
+            if any(keyword in lowered for keyword in keywords):
+                return level
+        return 'INFO'
     
     def clear_logs(self):
         """清空日志"""
         try:
+            # 丢弃待刷新的实时日志，避免清空后重新出现
+            self._flush_timer.stop()
+            self._pending_logs.clear()
+
             # 清空内存中的日志
             if hasattr(log_memory_handler, 'clear'):
                 log_memory_handler.clear()
@@ -1619,6 +1631,8 @@ class LogWindow(QWidget):
         """窗口关闭事件"""
         try:
             # 停止定时器
+            self._flush_timer.stop()
+
             if hasattr(self, 'timer'):
                 self.timer.stop()
 